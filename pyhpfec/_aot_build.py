@@ -0,0 +1,44 @@
+#
+# Copyright (C) 2025 Kris Kirby
+#
+# This file is part of PyHPFEC.
+#
+# PyHPFEC is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with PyHPFEC. If not, see <http://www.gnu.org/licenses/>.
+#
+
+"""
+Ahead-of-time (AOT) compilation of the per-frame channel kernels.
+
+Builds the extension module pyhpfec.pyhpfec_kernels from the same Python
+sources as the JIT kernels, so short-lived processes skip the first-call
+compilation. The modules use the AOT kernels when the extension is present
+and fall back to the numba JIT versions otherwise.
+
+Built by setup.py (see cc.distutils_extension()), or in place with:
+
+    python -m pyhpfec._aot_build
+"""
+
+import os
+from numba.pycc import CC
+from . import modem, rate_match
+
+cc = CC('pyhpfec_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.verbose = False
+
+# Only kernels called from Python are exported: AOT functions cannot be called
+# from other numba kernels. The PEXT/PDEP kernels stay JIT-only because their
+# instruction selection depends on the CPU they run on.
+cc.export('bpsk_modulate', 'void(u1[:], f8[:])')(modem._numba_bpsk_modulate.py_func)
+cc.export('bpsk_modulate_packed', 'void(u1[:], u8[:], i1[::1])')(modem._numba_bpsk_modulate_packed.py_func)
+cc.export('demod_depuncture', 'void(f8[:], f8, i4[:], f8[:])')(rate_match._numba_demod_depuncture.py_func)
+
+if __name__ == '__main__':
+    cc.compile()
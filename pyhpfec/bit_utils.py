@@ -0,0 +1,33 @@
+#
+# Copyright (C) 2025 Kris Kirby
+#
+# This file is part of PyHPFEC.
+#
+# PyHPFEC is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# You should have received a copy of the GNU General Public License
+# along with PyHPFEC. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import numpy as np
+
+# --- Bitpacking Utilities ---
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """
+    Packs one-bit-per-byte data (0/1) into uint64 words.
+    Bit j of word w holds bits[64 * w + j] (LSB first).
+    """
+    packed = np.packbits(bits, bitorder='little')
+    padded = np.zeros(((len(packed) + 7) >> 3) << 3, dtype=np.uint8)
+    padded[:len(packed)] = packed
+    return padded.view('<u8').astype(np.uint64, copy=False)
+
+def unpack_bits(words: np.ndarray, n: int) -> np.ndarray:
+    """Inverse of pack_bits: unpacks the first n bits of uint64 words to one bit per byte."""
+    return np.unpackbits(words.astype('<u8', copy=False).view(np.uint8), count=n, bitorder='little')
+
+# --- Class implementation is omitted as this file only contains utility functions ---
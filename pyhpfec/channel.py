@@ -13,6 +13,16 @@
 #
 
 import numpy as np
+from typing import NamedTuple
+
+class RxBlock(NamedTuple):
+    """
+    Output of AWGNChannel.transmit / transmit_batch.
+    symbols is a plain ndarray (1-D, or (B, n) for a batch); noise_variance is
+    the channel's sigma^2, needed for LLR demodulation.
+    """
+    symbols: np.ndarray
+    noise_variance: float
 
 class AWGNChannel:
     """
@@ -20,60 +30,130 @@ class AWGNChannel:
     Calculates noise variance based on Eb/No ratio.
     """
     
-    def __init__(self, EbNo_dB: float):
+    def __init__(self, EbNo_dB: float, seed: int = None):
         """
         :param EbNo_dB: Energy per bit to Noise Power Spectral Density ratio in dB.
+        :param seed: Seed for the channel's noise generator (optional, for reproducible runs).
         """
         self.EbNo_dB = EbNo_dB
         self.EbNo = 10**(EbNo_dB / 10.0)
+        
+        # Per-channel PCG64 generator and a reusable noise buffer (sized on first use)
+        self._rng = np.random.default_rng(seed)
+        self._noise_buf = None
 
-    def _calculate_noise_power(self, R: float) -> float:
+    def _calculate_noise_power(self, R: float, bits_per_symbol: int = 1) -> float:
         """
         Calculates the required noise power spectral density (N0) or variance (sigma^2).
         
         Relationships:
-        1. E_b/N0 = (E_s / R) / N0
-        2. E_s (Symbol Energy) is often normalized to 1.0.
-        3. If E_s = 1, then E_b/N0 = 1 / (R * N0).
-        4. N0 = 1 / (R * E_b/N0).
-        5. Noise Variance (sigma^2) = N0 / 2 (for real-valued symbols).
+        1. Each symbol carries m = bits_per_symbol coded bits, i.e. R * m information bits.
+        2. E_b/N0 = (E_s / (R * m)) / N0
+        3. E_s (Symbol Energy) is often normalized to 1.0.
+        4. If E_s = 1, then E_b/N0 = 1 / (R * m * N0).
+        5. N0 = 1 / (R * m * E_b/N0).
+        6. Noise Variance (sigma^2) = N0 / 2 (per real dimension).
         """
         # Assuming symbol energy E_s = 1.0 (standard normalization)
         
         # N0
-        N0 = 1.0 / (R * self.EbNo)
+        N0 = 1.0 / (R * bits_per_symbol * self.EbNo)
         
-        # Noise variance (sigma^2) for the real-valued AWGN channel
+        # Noise variance (sigma^2) per real dimension of the AWGN channel
         sigma_sq = N0 / 2.0
         
         return sigma_sq
 
-    def transmit(self, tx_symbols: np.ndarray, k: int, n: int) -> np.ndarray:
+    def _fill_noise(self, noise: np.ndarray, noise_std_dev: float) -> None:
+        """
+        Fills noise in place with Gaussian samples of standard deviation
+        noise_std_dev per real dimension (real and imaginary parts are drawn
+        independently for complex buffers).
+        """
+        real_view = noise.view(np.float64) if np.iscomplexobj(noise) else noise
+        self._rng.standard_normal(out=real_view)
+        np.multiply(real_view, noise_std_dev, out=real_view)
+
+    def transmit(self, tx_symbols: np.ndarray, k: int, n: int, out: np.ndarray = None,
+                 bits_per_symbol: int = None) -> RxBlock:
         """
         Adds Gaussian noise to transmitted symbols.
         
-        :param tx_symbols: Transmitted symbols (+1/-1).
+        :param tx_symbols: Transmitted unit-energy symbols (+1/-1 real, or complex e.g. QPSK).
         :param k: Number of information bits.
         :param n: Number of coded bits (codeword length).
-        :returns: Received symbols (tx_symbols + noise).
+        :param out: Optional buffer (same shape as tx_symbols; float64, or complex128
+                    for complex symbols) for the received symbols.
+        :param bits_per_symbol: Coded bits per symbol (defaults to 1 for real symbols
+                                and 2 (QPSK) for complex ones).
+        :returns: RxBlock(symbols, noise_variance) - received symbols (tx_symbols + noise)
+                  and the noise variance (sigma^2 per real dimension) needed for LLR demodulation.
         """
         if k <= 0 or n <= 0:
             raise ValueError("k and n must be positive.")
+        if bits_per_symbol is None:
+            bits_per_symbol = 2 if np.iscomplexobj(tx_symbols) else 1
             
         # Calculate code rate
         R = k / n
         
         # Calculate noise variance (sigma^2)
-        sigma_sq = self._calculate_noise_power(R)
+        sigma_sq = self._calculate_noise_power(R, bits_per_symbol)
         
-        # Generate Gaussian noise (mean 0, variance sigma^2)
+        # Generate Gaussian noise (mean 0, variance sigma^2 per real dimension) in place
         noise_std_dev = np.sqrt(sigma_sq)
-        noise = np.random.normal(0.0, noise_std_dev, tx_symbols.shape)
+        dtype = np.result_type(tx_symbols, np.float64)
+        if self._noise_buf is None or self._noise_buf.shape != tx_symbols.shape or self._noise_buf.dtype != dtype:
+            self._noise_buf = np.empty(tx_symbols.shape, dtype=dtype)
+        noise = self._noise_buf
+        self._fill_noise(noise, noise_std_dev)
         
         # Received symbols
-        rx_symbols = tx_symbols + noise
+        if out is None:
+            out = np.empty(tx_symbols.shape, dtype=dtype)
+        rx_symbols = np.add(tx_symbols, noise, out=out)
         
-        # Attach noise variance to symbols for accurate LLR demodulation
-        rx_symbols.noise_variance = sigma_sq
-        return rx_symbols
+        # The noise variance travels alongside the symbols (a plain ndarray
+        # cannot carry extra attributes) for accurate LLR demodulation
+        return RxBlock(rx_symbols, sigma_sq)
 
+    def transmit_batch(self, tx_symbols: np.ndarray, k: int, n: int, out: np.ndarray = None,
+                       bits_per_symbol: int = None) -> RxBlock:
+        """
+        Adds Gaussian noise to a batch of B transmitted codewords in one call.
+        
+        All B x n noise samples are drawn by a single standard_normal call, so
+        Monte-Carlo BER sweeps pay the per-call overhead once per batch rather
+        than once per trial. Downstream decoders should likewise consume the
+        (B, n) LLR block as a whole (e.g. parallelized over the batch axis).
+        
+        :param tx_symbols: Transmitted unit-energy symbols (+1/-1 real, or complex),
+                           shape (B, n // bits_per_symbol).
+        :param k: Number of information bits.
+        :param n: Number of coded bits (codeword length).
+        :param out: Optional buffer shaped like tx_symbols (float64, or complex128 for
+                    complex symbols) for the received symbols.
+        :param bits_per_symbol: Coded bits per symbol (defaults to 1 for real symbols
+                                and 2 (QPSK) for complex ones).
+        :returns: RxBlock(symbols, noise_variance) - received symbols shaped like tx_symbols
+                  and the noise variance (sigma^2 per real dimension), shared by the whole batch.
+        """
+        if k <= 0 or n <= 0:
+            raise ValueError("k and n must be positive.")
+        if bits_per_symbol is None:
+            bits_per_symbol = 2 if np.iscomplexobj(tx_symbols) else 1
+        if tx_symbols.ndim != 2 or tx_symbols.shape[1] * bits_per_symbol != n:
+            raise ValueError(f"tx_symbols must have shape (B, {n // bits_per_symbol})")
+            
+        sigma_sq = self._calculate_noise_power(k / n, bits_per_symbol)
+        noise_std_dev = np.sqrt(sigma_sq)
+        
+        # One draw for the whole batch, scaled in place
+        noise = np.empty(tx_symbols.shape, dtype=np.result_type(tx_symbols, np.float64))
+        self._fill_noise(noise, noise_std_dev)
+        
+        if out is None:
+            out = noise # Reuse the noise allocation for the result
+        rx_symbols = np.add(tx_symbols, noise, out=out)
+        
+        return RxBlock(rx_symbols, sigma_sq)
@@ -18,28 +18,22 @@
 #
 
 import numpy as np
-from numba import njit, int32, uint8
+from numba import njit, int32, uint8, uint16, void
 
 # --- Numba JIT-Compiled GF Arithmetic Functions ---
 
-@njit(int32(int32, int32, uint8[:], uint8[:], int32), cache=True)
+@njit(int32(int32, int32, uint16[:], uint8[:], int32), cache=True)
 def gf_multiply(a: int, b: int, log_table: np.ndarray, anti_log_table: np.ndarray, M: int) -> int:
     """
     Performs GF(2^M) multiplication using Log/Anti-Log tables.
     The tables MUST be pre-calculated and passed from GFContext.
-    """
-    if a == 0 or b == 0:
-        return 0
-    
-    # Indices are based on non-zero elements (alpha^index)
-    log_a = log_table[a]
-    log_b = log_table[b]
-    
-    # Exponent addition (modulo Q-1, where Q-1 = 2^M - 1)
-    # The modulus is 2^M - 1. We use (1 << M) - 1.
-    result_idx = (log_a + log_b) % ((1 << M) - 1)
     
-    return anti_log_table[result_idx]
+    log(0) is 2Q-3 and the Anti-Log table has 4Q-5 entries (see GFContext):
+    sums of two non-zero logs index its first 2Q-3 entries without a modulo
+    reduction, and any sum involving log(0) lands in the zero-filled upper
+    part, so zero operands need no branch.
+    """
+    return anti_log_table[log_table[a] + log_table[b]]
 
 @njit(int32(int32, uint8[:]), cache=True)
 def gf_inverse(a: int, inv_table: np.ndarray) -> int:
@@ -50,6 +44,78 @@ def gf_inverse(a: int, inv_table: np.ndarray) -> int:
         return 0 # No inverse for zero
     return inv_table[a]
 
+@njit(void(uint8[:], int32, uint16[:], uint8[:], int32), cache=True)
+def gf_region_multiply(region: np.ndarray, c: int, log_table: np.ndarray, anti_log_table: np.ndarray, M: int) -> None:
+    """
+    Multiplies every element of a GF(2^M) region by the constant c, in place.
+    The log of the constant is looked up once, so each element costs a single
+    exponent addition instead of a full gf_multiply call. Zero elements (and
+    c == 0) map to zero through the table, so the loop is branch-free.
+    """
+    log_c = log_table[c]
+    for w in range(len(region)):
+        region[w] = anti_log_table[log_table[region[w]] + log_c]
+
+@njit(int32(int32, int32, uint16[:], int32), cache=True)
+def gf_log_add(log_a: int, log_b: int, zech_table: np.ndarray, Q: int) -> int:
+    """
+    Performs GF(2^M) addition of two elements given (and returned) in log form,
+    using Zech's logarithm: alpha^a + alpha^b = alpha^(a + Z(b - a)).
+    2Q-3 is the log of zero, matching GFContext.log_table[0].
+    """
+    Q_minus_1 = Q - 1
+    log_zero = 2 * Q - 3
+    if log_a == log_zero:
+        return log_b
+    if log_b == log_zero:
+        return log_a
+    
+    diff = log_b - log_a
+    if diff < 0:
+        diff += Q_minus_1
+    z = zech_table[diff]
+    if z == log_zero:
+        return log_zero # alpha^a + alpha^a = 0
+    
+    result = log_a + z
+    if result >= Q_minus_1:
+        result -= Q_minus_1
+    return result
+
+@njit(cache=True)
+def _build_gf_tables(M: int, P_poly: int) -> tuple:
+    """
+    Builds the Log table (size Q) and one period of the Anti-Log table (size Q-1)
+    for GF(2^M) generated by the primitive polynomial P_poly.
+    """
+    Q = 1 << M
+    Q_minus_1 = Q - 1
+    log_table = np.zeros(Q, dtype=np.uint16)
+    anti_log_table = np.zeros(Q_minus_1, dtype=np.uint8)
+    
+    # Galois Field element alpha^i (current field element)
+    alpha_i = 1
+    for i in range(Q_minus_1):
+        if alpha_i >= Q:
+            # This should not happen if the polynomial is primitive.
+            raise RuntimeError("Polynomial is not primitive or table overflow.")
+        
+        # Map the power (i) to the element (alpha_i) and back
+        anti_log_table[i] = alpha_i
+        log_table[alpha_i] = i
+        
+        # Calculate the next element: alpha^(i+1) = alpha^i * alpha
+        # (left shift, then XOR with P(x) if the high bit is set)
+        alpha_i <<= 1
+        if alpha_i & Q:
+            alpha_i ^= P_poly
+    
+    # Handle zero element
+    # Log(0) is undefined; 2Q-3 is the smallest sentinel whose sums with any
+    # log lie beyond all sums of two non-zero logs (at most 2Q-4)
+    log_table[0] = 2 * Q - 3
+    return log_table, anti_log_table
+
 # --- GF Context Class ---
 
 class GFContext:
@@ -57,7 +123,8 @@ class GFContext:
     Galois Field Context. Pre-calculates Log, Anti-Log, and Inverse tables
     for GF(2^M) to enable high-speed, thread-safe arithmetic.
     
-    M must be <= 16 due to table size limits.
+    M must be <= 8: field elements are stored as uint8, and log(0) = 2Q-3
+    must fit the uint16 log table.
     """
     
     def __init__(self, M: int, P_poly: int = None):
@@ -67,8 +134,8 @@ class GFContext:
         :param M: The power of the field (2^M).
         :param P_poly: The primitive polynomial value (optional, uses standard if None).
         """
-        if not 2 <= M <= 16:
-            raise ValueError("M must be between 2 and 16.")
+        if not 2 <= M <= 8:
+            raise ValueError("M must be between 2 and 8.")
             
         self.M = M
         self.Q = 1 << M # Q = 2^M
@@ -97,40 +164,24 @@ class GFContext:
         """
         Q_minus_1 = self.Q - 1
         
-        # Initialize tables
-        self.anti_log_table = np.zeros(self.Q, dtype=uint8)
-        self.log_table = np.zeros(self.Q, dtype=uint8)
-        self.inv_table = np.zeros(self.Q, dtype=uint8)
-        
-        # Galois Field element alpha^i (current field element)
-        alpha_i = 1 
+        # --- Main Table Generation (JIT-compiled loop) ---
+        log_table, alpha_powers = _build_gf_tables(self.M, self.P_poly)
         
-        # --- Main Table Generation Loop ---
-        for i in range(Q_minus_1):
-            if alpha_i >= self.Q:
-                # This should not happen if the polynomial is primitive.
-                raise RuntimeError("Polynomial is not primitive or table overflow.")
-
-            # Map the power (i) to the element (alpha_i)
-            self.anti_log_table[i] = alpha_i
-            # Map the element (alpha_i) to the power (i)
-            self.log_table[alpha_i] = i
-            
-            # Calculate the next element: alpha^(i+1) = alpha^i * alpha
-            # This is done by left shift (multiplication by x)
-            alpha_i <<= 1
-            
-            # Reduction: If the high bit is set (overflow beyond Q-1), 
-            # XOR with the primitive polynomial P(x).
-            if alpha_i & self.Q:
-                alpha_i ^= self.P_poly
-                
-        # Handle zero element
-        self.log_table[0] = Q_minus_1 # Log(0) is undefined, use Q-1 as sentinel
+        # The Anti-Log table covers every sum of two logs (4Q-5 entries): indices
+        # 0..2Q-4 repeat the powers of alpha so no modulo reduction is needed, and
+        # indices 2Q-3..4Q-6 (sums involving log(0) = 2Q-3) hold zero
+        self.anti_log_table = np.zeros(4 * self.Q - 5, dtype=np.uint8)
+        self.anti_log_table[:Q_minus_1] = alpha_powers
+        self.anti_log_table[Q_minus_1:2 * self.Q - 3] = alpha_powers[:Q_minus_1 - 1]
+        self.log_table = log_table
         
         # --- Inverse Table Generation ---
         # The inverse of alpha^i is alpha^(Q-1 - i)
-        for i in range(1, self.Q):
-            inv_power = (Q_minus_1 - self.log_table[i]) % Q_minus_1
-            self.inv_table[i] = self.anti_log_table[inv_power]
+        self.inv_table = np.zeros(self.Q, dtype=np.uint8)
+        self.inv_table[1:] = self.anti_log_table[(Q_minus_1 - self.log_table[1:].astype(np.int64)) % Q_minus_1]
+            
+        # --- Zech's Logarithm Table ---
+        # alpha^zech_table[i] = 1 + alpha^i for i = 0..Q-2; i = 0 gives 1 + 1 = 0,
+        # i.e. the 2Q-3 sentinel
+        self.zech_table = self.log_table[1 ^ self.anti_log_table[:Q_minus_1]]
 
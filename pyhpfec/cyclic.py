@@ -13,40 +13,24 @@
 #
 
 import numpy as np
-from numba import njit, int32, uint8
+from numba import njit, int32, float64, uint8, uint64, void
+from numba.cpython.unsafe.numbers import trailing_zeros
+from .bit_utils import pack_bits
 from .config import GFContext, gf_multiply, gf_inverse
 from .llr_utils import llr_to_hard_bits
 
 # --- Numba JIT-Compiled Core Kernels ---
 
-@njit(int32[:](uint8[:], uint8[:], int32), cache=True)
-def _numba_cyclic_division(data: np.ndarray, generator: np.ndarray, k: int) -> np.ndarray:
-    """
-    Performs binary polynomial division (XOR-based) to find the remainder (parity).
-    This is the core of cyclic encoding (BCH/Hamming).
-    """
-    g_len = len(generator)
-    n = len(data) # n = k + (g_len - 1)
-    
-    # Start with the data bits shifted by the degree of g(x)
-    working_frame = np.concatenate((data, np.zeros(g_len - 1, dtype=uint8)))
-    
-    # Process k data bits
-    for i in range(k):
-        if working_frame[i] == 1:
-            # XOR the working frame with the generator polynomial
-            # The XOR starts at index i to align the leading '1's
-            working_frame[i : i + g_len] ^= generator
-            
-    # The remainder (parity) is the last g_len - 1 bits
-    return working_frame[n - g_len + 1 : n]
-
-@njit(int32[:](uint8[:], uint8[:], uint8[:], int32, int32, int32, int32), cache=True)
-def _numba_calculate_syndromes(codeword: np.ndarray, primitive_element_powers: np.ndarray, 
-                                inv_table: np.ndarray, M: int, Q: int, t: int, n: int) -> np.ndarray:
+@njit(int32[:](uint64[:], uint8[:, :], int32), cache=True)
+def _numba_calculate_syndromes(codeword_packed: np.ndarray, pow_table: np.ndarray, t: int) -> np.ndarray:
     """
     Calculates 2t syndromes S_1, S_2, ..., S_{2t} for the received codeword.
     This is performed in GF(2^M).
+    
+    The codeword is bitpacked (see pack_bits) and pow_table[i, j] = (alpha^i)^j
+    is precomputed per code. Each syndrome XOR-reduces the table entries of the
+    set codeword bits only, found word by word with a trailing-zero count, so
+    zero words and zero bits cost nothing.
     """
     syndromes = np.zeros(2 * t + 1, dtype=int32) # S_0 to S_2t
     
@@ -55,21 +39,105 @@ def _numba_calculate_syndromes(codeword: np.ndarray, primitive_element_powers: n
     # R(alpha^i) = sum_{j=0}^{n-1} r_j * (alpha^i)^j
     for i in range(1, 2 * t + 1):
         syndrome_value = 0
-        alpha_i = primitive_element_powers[i] # alpha^i in GF element form
-        current_power = 1 # (alpha^i)^0 = 1
-        
-        for j in range(n):
-            if codeword[j] == 1:
-                # syndrome_value = syndrome_value XOR current_power (addition in GF(2^M))
-                syndrome_value ^= current_power 
-            
-            # current_power = current_power * alpha^i (multiplication in GF(2^M))
-            current_power = gf_multiply(current_power, alpha_i, inv_table, inv_table, M) # Using inv_table as a temporary log/anti-log table placeholder (since njit signature requires exact types, this is for demonstration. Actual impl would need careful parameter passing)
-            
+        for w in range(len(codeword_packed)):
+            word = codeword_packed[w]
+            base = w << 6
+            while word != 0:
+                # Addition in GF(2^M) is XOR
+                syndrome_value ^= pow_table[i, base + trailing_zeros(word)]
+                word &= word - uint64(1) # Clear the lowest set bit
         syndromes[i] = syndrome_value
         
     return syndromes[1:] # Return S_1 to S_2t
 
+@njit(float64[:](float64[:]), cache=True)
+def _numba_chase_pattern_metrics(rel_L: np.ndarray) -> np.ndarray:
+    """
+    Soft metric of every Chase test pattern: metric[p] is the sum of the
+    reliabilities of the least reliable bits flipped by pattern p (bit b of p
+    flips position b). Costs O(L) per pattern instead of O(n).
+    """
+    num_L = len(rel_L)
+    metrics = np.zeros(1 << num_L, dtype=float64)
+    for p in range(1 << num_L):
+        metric = 0.0
+        for b in range(num_L):
+            metric += rel_L[b] * ((p >> b) & 1)
+        metrics[p] = metric
+    return metrics
+
+# --- Specialized Encoders (generated per generator polynomial) ---
+
+# Compiled encoders keyed by (tuple(generator), k), shared by all coder instances
+_SPECIALIZED_ENCODERS = {}
+
+_SPECIALIZED_ENCODER_TEMPLATE = """
+@njit(void(uint8[:, :]))
+def _encode_specialized(codewords):
+    for b in range(codewords.shape[0]):
+        codeword = codewords[b]
+{init}
+        for i in range({k}):
+            fb = uint64(0) - (r0 & uint64(1))
+{shift}
+            if i < {k_feed}:
+                r{last} |= uint64(codeword[i + {r}]) << uint64({top_bit})
+{xors}
+{store}
+"""
+
+def _make_specialized_encoder(generator: np.ndarray, k: int):
+    """
+    Generates and compiles an in-place systematic encoder for one (g(x), k).
+    
+    The systematic encoder divides the frame [data | 0] by g(x) and keeps the
+    remainder (parity). The division runs as a shift register of ceil(r / 64)
+    uint64 locals holding frame bits [i, i + r). Each step shifts the
+    register by one bit and XORs the packed g(x) / x words, which appear as
+    literal constants (all-zero words are omitted), so k, r and every generator
+    coefficient are compile-time constants of the emitted function.
+    
+    :param generator: g(x) coefficients, lowest degree first (uint8, length r + 1).
+    :param k: Data length.
+    :returns: A compiled function encoding every row of a uint8 (B, n) array in
+              place (data bits in [:k] on entry, parity written to [k:]).
+    """
+    key = (tuple(int(g) for g in generator), k)
+    encoder = _SPECIALIZED_ENCODERS.get(key)
+    if encoder is not None:
+        return encoder
+    
+    r = len(generator) - 1
+    num_words = (r + 63) >> 6
+    # Feedback mask: bit j is the coefficient of x^(j + 1)
+    feedback = pack_bits(np.asarray(generator[1:], dtype=np.uint8))[:num_words]
+    
+    ind = " " * 8
+    init = [f"{ind}r{w} = uint64(0)" for w in range(num_words)]
+    for j in range(min(r, k)):
+        init.append(f"{ind}r{j >> 6} |= uint64(codeword[{j}]) << uint64({j & 63})")
+    shift = []
+    for w in range(num_words):
+        line = f"{ind}    r{w} >>= uint64(1)"
+        if w + 1 < num_words:
+            line += f"\n{ind}    r{w} |= r{w + 1} << uint64(63)"
+        shift.append(line)
+    xors = [f"{ind}    r{w} ^= uint64({int(feedback[w]):#x}) & fb"
+            for w in range(num_words) if feedback[w] != 0]
+    store = [f"{ind}codeword[{k + j}] = uint8((r{j >> 6} >> uint64({j & 63})) & uint64(1))"
+             for j in range(r)]
+    
+    source = _SPECIALIZED_ENCODER_TEMPLATE.format(
+        init="\n".join(init), k=k, k_feed=max(k - r, 0), shift="\n".join(shift),
+        last=num_words - 1, r=r, top_bit=(r - 1) & 63, xors="\n".join(xors),
+        store="\n".join(store))
+    namespace = {"njit": njit, "void": void, "uint8": uint8, "uint64": uint64}
+    exec(compile(source, f"<cyclic encoder g={key[0]} k={k}>", "exec"), namespace)
+    
+    encoder = namespace["_encode_specialized"]
+    _SPECIALIZED_ENCODERS[key] = encoder
+    return encoder
+
 # --- Hamming Coder (Simple Example) ---
 
 class HammingEncoder:
@@ -102,45 +170,73 @@ class BCHGolayCoder:
         self.t = t
         self.ctx = gf_context
         
-        # Placeholder for the generator polynomial (g(x)) coefficients
+        # Placeholder for the generator polynomial (g(x)) coefficients, lowest degree first
         # This requires calculation based on the minimal polynomials of alpha^1 to alpha^(2t)
-        self.generator_poly = np.array([1, 0, 1, 1, 0, 1, 1, 1], dtype=uint8) # Example for (15, 7) BCH
+        self.generator_poly = np.array([1, 0, 0, 0, 1, 0, 1, 1, 1], dtype=np.uint8) # (15, 7) BCH: 1 + x^4 + x^6 + x^7 + x^8
         self.r = len(self.generator_poly) - 1 # Parity length
+        
+        # Encoder compiled for this (g(x), k), shared with other instances of the same code
+        self._encode = _make_specialized_encoder(self.generator_poly, self.k)
 
         # Pre-calculate powers of alpha (primitive element) for syndrome calculation
         self.primitive_element_powers = self.ctx.anti_log_table 
         
-    def encode(self, data: np.ndarray) -> np.ndarray:
-        """Encodes k data bits into n codeword bits."""
+        # Syndrome evaluation table: pow_table[i, j] = (alpha^i)^j for i = 0..2t, j = 0..n-1
+        exponents = np.outer(np.arange(2 * self.t + 1), np.arange(self.n)) % (self.ctx.Q - 1)
+        self.pow_table = self.ctx.anti_log_table[exponents]
+        
+    def encode(self, data: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Encodes k data bits into n codeword bits.
+        
+        :param data: Data bits (uint8, shape (k,)).
+        :param out: Optional uint8 buffer of shape (n,) that receives the codeword
+                    in place (e.g. reused across calls by a single thread).
+        :returns: The systematic codeword [Data | Parity] (out, if given).
+        """
         if data.shape != (self.k,):
             raise ValueError(f"Input data must have shape ({self.k},)")
             
-        parity = _numba_cyclic_division(data, self.generator_poly, self.k)
+        if out is None:
+            out = np.empty(self.n, dtype=np.uint8)
+        elif out.shape != (self.n,) or out.dtype != np.uint8:
+            raise ValueError(f"Output buffer must be uint8 with shape ({self.n},)")
+            
+        # Codeword = [Data | Parity] (Systematic form), parity computed in place
+        out[:self.k] = data
+        self._encode(out[np.newaxis])
+        return out
+
+    def encode_batch(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encodes B blocks of k data bits at once.
         
-        # Codeword = [Data | Parity] (Systematic form)
-        codeword = np.concatenate((data, parity))
-        return codeword
+        :param data: Data bits (uint8, shape (B, k)).
+        :returns: Codewords (uint8, shape (B, n)).
+        """
+        if data.ndim != 2 or data.shape[1] != self.k:
+            raise ValueError(f"Input data must have shape (B, {self.k})")
+            
+        codewords = np.empty((data.shape[0], self.n), dtype=np.uint8)
+        codewords[:, :self.k] = data
+        self._encode(codewords)
+        return codewords
 
     def _calculate_syndromes(self, codeword: np.ndarray) -> np.ndarray:
-        """Internal helper to calculate S_1 to S_2t syndromes."""
-        # Note: This calls the Numba kernel. The context tables need to be handled carefully
-        # in Numba's signature (as seen in the placeholder above).
-        
-        # In the final implementation, we would pass all required tables (log, antilog, inv)
-        # to the Numba kernel directly. For this snippet, we assume the Numba kernel 
-        # is correctly passing and using the tables from the GFContext instance.
-        
-        # Placeholder for the actual call:
-        # return _numba_calculate_syndromes(codeword, self.primitive_element_powers, 
-        #                                    self.ctx.inv_table, self.ctx.M, self.ctx.Q, self.t, self.n)
-        
-        # Returning dummy data for placeholder completeness
-        return np.zeros(2 * self.t, dtype=int32) 
+        """
+        Internal helper to calculate S_1 to S_2t syndromes.
+        Accepts one bit per byte (uint8) or an already bitpacked (uint64) codeword.
+        """
+        if codeword.dtype != np.uint64:
+            codeword = pack_bits(codeword)
+        return _numba_calculate_syndromes(codeword, self.pow_table, self.t)
 
-    def _decode_algebraic(self, hard_codeword: np.ndarray) -> tuple:
+    def _correct_algebraic(self, hard_codeword: np.ndarray) -> tuple:
         """
         Performs the full algebraic hard-decision decoding sequence:
         Syndrome -> Berlekamp-Massey -> Chien Search -> Error correction.
+        
+        :returns: (corrected_codeword, errors_corrected)
         """
         syndromes = self._calculate_syndromes(hard_codeword)
         
@@ -159,6 +255,12 @@ class BCHGolayCoder:
         #    corrected_codeword[loc] ^= 1
         #    errors_corrected += 1
         
+        return corrected_codeword, errors_corrected
+
+    def _decode_algebraic(self, hard_codeword: np.ndarray) -> tuple:
+        """Algebraic hard-decision decoding; returns (decoded_data_bits, errors_corrected)."""
+        corrected_codeword, errors_corrected = self._correct_algebraic(hard_codeword)
+        
         # Extract data bits
         decoded_data = corrected_codeword[:self.k]
         
@@ -187,23 +289,39 @@ class BCHGolayCoder:
             
             # 3. Find the least reliable bits' indices (L)
             num_L = min(num_test_patterns, self.n)
-            least_reliable_indices = np.argsort(reliability)[:num_L]
+            # O(n) selection instead of a full sort; the order among the L indices
+            # does not matter since every 2^L pattern is tested
+            least_reliable_indices = np.argpartition(reliability, num_L - 1)[:num_L]
             
             # 4. Generate test patterns (2^L patterns)
-            # Placeholder for the Chase iteration loop:
+            # The metric of a pattern only depends on the L flipped reliabilities
+            rel_L = reliability[least_reliable_indices]
+            pattern_metrics = _numba_chase_pattern_metrics(rel_L.astype(np.float64))
             
             best_codeword = hard_codeword
-            min_metric = np.sum(reliability * (1 - 2 * hard_codeword) * (1 - 2 * hard_codeword)) # Initial metric
-            
-            # Loop over all 2^num_L test patterns (complex Numba kernel) 
+            min_metric = float(reliability.sum()) # Initial metric (every bit flipped)
             
-            # For each pattern (P):
-            #   test_codeword = (hard_codeword XOR pattern)
-            #   decoded_cw, corrected_errors = self._decode_algebraic(test_codeword)
-            #   metric = calculate_metric(decoded_cw, input_data)
-            #   if metric < min_metric:
-            #       min_metric = metric
-            #       best_codeword = decoded_cw
+            # Loop over all 2^num_L test patterns
+            test_codeword = np.empty_like(hard_codeword)
+            for pattern in range(1 << num_L):
+                # test_codeword = (hard_codeword XOR pattern)
+                test_codeword[:] = hard_codeword
+                for b in range(num_L):
+                    if (pattern >> b) & 1:
+                        test_codeword[least_reliable_indices[b]] ^= 1
+                
+                decoded_cw, corrected_errors = self._correct_algebraic(test_codeword)
+                
+                # Metric = sum of reliabilities of bits differing from the hard decision;
+                # only positions changed by the algebraic decoder need an O(n) pass
+                if corrected_errors == 0:
+                    metric = pattern_metrics[pattern]
+                else:
+                    metric = float(reliability[decoded_cw != hard_codeword].sum())
+                
+                if metric < min_metric:
+                    min_metric = metric
+                    best_codeword = decoded_cw
                 
             # Final result extracted from the best codeword
             decoded_data = best_codeword[:self.k]
@@ -13,61 +13,172 @@
 #
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 from scipy.sparse import csr_matrix # Use scipy for sparse matrix operations
-from .llr_utils import llr_to_hard_bits, log_map_approx
+from .llr_utils import quantize_llrs
 
-# --- Numba JIT-Compiled Belief Propagation Kernel ---
+# --- Numba JIT-Compiled Belief Propagation Kernels ---
+
+# Min / second-min sentinel of the float check node update (the outgoing magnitude of
+# a degree-1 check); finite to stay fastmath-safe, and far enough below the float32
+# maximum that the variable node sums of several such messages cannot overflow
+_MSG_MAX_MAG = np.float32(1e30)
 
 @njit(cache=True)
-def _numba_ldpc_bp_kernel(llrs: np.ndarray, H_rows: np.ndarray, H_cols: np.ndarray, H_data: np.ndarray, max_iterations: int) -> np.ndarray:
+def _min_sum_check_node(lambda_vc: np.ndarray, lambda_cv: np.ndarray, start: int, end: int, max_mag) -> None:
+    """
+    Min-Sum check node update for the edges [start, end) of one row of H.
+    
+    Two-pass min / second-min: |msg| is the smallest incoming magnitude
+    excluding the edge itself, sign is the XOR of the other signs.
+    Works for both float and int8 (quantized) message arrays; max_mag is the
+    largest representable magnitude of the message type.
+    """
+    min1 = max_mag
+    min2 = max_mag
+    min_edge = -1
+    sign = 0
+    for e in range(start, end):
+        v = lambda_vc[e]
+        mag = abs(v)
+        if v < 0:
+            sign ^= 1
+        if mag < min1:
+            min2 = min1
+            min1 = mag
+            min_edge = e
+        elif mag < min2:
+            min2 = mag
+    
+    for e in range(start, end):
+        mag = min2 if e == min_edge else min1
+        edge_sign = sign ^ (1 if lambda_vc[e] < 0 else 0)
+        lambda_cv[e] = -mag if edge_sign else mag
+
+@njit(parallel=True, cache=True)
+def _syndrome_weight(hard_bits: np.ndarray, H_rows: np.ndarray, H_cols: np.ndarray) -> int:
+    """Number of unsatisfied parity checks for the given hard decision."""
+    M = len(H_rows) - 1
+    syndrome = 0
+    for i in prange(M):
+        parity = 0
+        for e in range(H_rows[i], H_rows[i+1]):
+            parity ^= hard_bits[H_cols[e]]
+        syndrome += parity
+    return syndrome
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _numba_ldpc_bp_kernel(llrs: np.ndarray, H_rows: np.ndarray, H_cols: np.ndarray, H_col_ptr: np.ndarray, H_col_edges: np.ndarray, max_iterations: int, hard_bits: np.ndarray) -> None:
     """
-    Core kernel for the iterative Belief Propagation (BP) decoder (Min-Sum or Sum-Product).
-    The sparse Parity Check Matrix (H) must be passed in CSR format data/indices.
+    Core kernel for the iterative Belief Propagation (BP) decoder (Min-Sum).
+    The sparse Parity Check Matrix (H) must be passed in CSR format data/indices:
+    H_rows is the row pointer array and H_cols the column index of every edge.
+    The column view is passed as CSC pointers H_col_ptr plus H_col_edges, the
+    CSR edge index of every CSC entry (see LDPCoder.__init__).
+    
+    llrs must be float32; messages are stored per edge (CSR order) as contiguous
+    float32 arrays, and both node updates run in parallel (prange) over check
+    nodes / edges. The decision is written into the uint8 output hard_bits.
     """
     N = len(llrs)
     M = len(H_rows) - 1 # Number of parity checks
+    num_edges = len(H_cols)
+    
+    # Initial LLRs (a-priori from channel), used read-only
+    L_a = llrs
+    L_final = np.empty(N, dtype=np.float32)
     
     # Initialization of messages
-    # V->C messages (LLRs from Variable Nodes to Check Nodes)
-    lambda_vc = np.zeros(len(H_data)) 
+    # V->C messages (LLRs from Variable Nodes to Check Nodes), start at the channel LLRs
+    lambda_vc = np.empty(num_edges, dtype=np.float32)
+    for e in prange(num_edges):
+        lambda_vc[e] = L_a[H_cols[e]]
     # C->V messages (Extrinsic LLRs from Check Nodes to Variable Nodes)
-    lambda_cv = np.zeros(len(H_data))
+    lambda_cv = np.zeros(num_edges, dtype=np.float32)
     
-    # Initial LLRs (a-priori from channel)
-    L_a = llrs.copy()
+    for j in prange(N):
+        hard_bits[j] = 1 if L_a[j] < 0.0 else 0
     
     for iteration in range(max_iterations):
-        # 1. Check Node Processing (C->V Message Update)
-        # Apply the Log-MAP approximation (Min-Sum)
-        for i in range(M): # Iterate over check nodes (rows of H)
-            start = H_rows[i]
-            end = H_rows[i+1]
-            
-            # Placeholder for Min-Sum (C-N Update) logic:
-            # - Find the minimum value among incoming V->C messages
-            # - Propagate the check node output (C->V)
-            pass
+        # 1. Check Node Processing (C->V Message Update), Min-Sum
+        for i in prange(M): # Iterate over check nodes (rows of H)
+            _min_sum_check_node(lambda_vc, lambda_cv, H_rows[i], H_rows[i+1], _MSG_MAX_MAG)
             
         # 2. Variable Node Processing (V->C Message Update)
-        for j in range(N): # Iterate over variable nodes (columns of H)
-            start = H_cols[j]
-            end = H_cols[j+1]
+        for j in prange(N): # Iterate over variable nodes (columns of H)
+            start = H_col_ptr[j]
+            end = H_col_ptr[j+1]
+            
+            # L_final = L_a + sum(all incoming C->V messages)
+            total = L_a[j]
+            for c in range(start, end):
+                total += lambda_cv[H_col_edges[c]]
+            L_final[j] = total
             
-            # Placeholder for V-N Update logic:
-            # - Sum the a-priori LLR (L_a[j]) and all incoming C->V messages
-            # - For each outgoing message, subtract the corresponding C->V message
-            pass
+            # Each outgoing message excludes the corresponding incoming C->V message
+            for c in range(start, end):
+                e = H_col_edges[c]
+                lambda_vc[e] = total - lambda_cv[e]
 
         # 3. Hard Decision & Stopping Check
-        L_final = L_a.copy()
-        # L_final = L_a + sum(all incoming C->V messages)
-        # Placeholder for final LLR calculation and Syndrome check...
+        for j in prange(N):
+            hard_bits[j] = 1 if L_final[j] < 0.0 else 0
         
-        # if syndrome == 0: break
+        if _syndrome_weight(hard_bits, H_rows, H_cols) == 0:
+            break
+
+@njit(parallel=True, cache=True)
+def _numba_ldpc_bp_kernel_q(llrs_q: np.ndarray, H_rows: np.ndarray, H_cols: np.ndarray, H_col_ptr: np.ndarray, H_col_edges: np.ndarray, max_iterations: int, max_mag: int, hard_bits: np.ndarray) -> None:
+    """
+    Quantized variant of _numba_ldpc_bp_kernel (scaled Min-Sum on int8 messages).
     
-    # Final hard decision
-    return llr_to_hard_bits(L_final)
+    llrs_q are fixed-point channel LLRs (see quantize_llrs) saturated to
+    [-max_mag, max_mag]. The check node update is pure abs/min/sign on int8;
+    variable node totals accumulate in int16 and outgoing messages are
+    saturated back to int8.
+    """
+    N = len(llrs_q)
+    M = len(H_rows) - 1 # Number of parity checks
+    num_edges = len(H_cols)
+    
+    L_total = np.empty(N, dtype=np.int16)
+    
+    # V->C messages start at the channel LLRs, C->V messages at zero
+    lambda_vc = np.empty(num_edges, dtype=np.int8)
+    for e in prange(num_edges):
+        lambda_vc[e] = llrs_q[H_cols[e]]
+    lambda_cv = np.zeros(num_edges, dtype=np.int8)
+    
+    for j in prange(N):
+        hard_bits[j] = 1 if llrs_q[j] < 0 else 0
+    
+    for iteration in range(max_iterations):
+        # 1. Check Node Processing (C->V Message Update)
+        for i in prange(M):
+            _min_sum_check_node(lambda_vc, lambda_cv, H_rows[i], H_rows[i+1], np.int8(max_mag))
+            
+        # 2. Variable Node Processing (V->C Message Update), int16 accumulator
+        for j in prange(N):
+            start = H_col_ptr[j]
+            end = H_col_ptr[j+1]
+            
+            total = np.int16(llrs_q[j])
+            for c in range(start, end):
+                total += lambda_cv[H_col_edges[c]]
+            L_total[j] = total
+            
+            # Saturating subtract back into the int8 message range
+            for c in range(start, end):
+                e = H_col_edges[c]
+                msg = np.int16(total - lambda_cv[e])
+                lambda_vc[e] = max(-max_mag, min(max_mag, msg))
+            
+        # 3. Hard Decision & Stopping Check
+        for j in prange(N):
+            hard_bits[j] = 1 if L_total[j] < 0 else 0
+        
+        if _syndrome_weight(hard_bits, H_rows, H_cols) == 0:
+            break
 
 # --- LDPC Encoder/Decoder ---
 
@@ -76,22 +187,34 @@ class LDPCoder:
     LDPC (Low-Density Parity Check) Code Encoder and Belief Propagation Decoder.
     """
     
-    def __init__(self, H_matrix: csr_matrix, max_iterations: int = 50):
+    def __init__(self, H_matrix: csr_matrix, max_iterations: int = 50, quantize_bits: int = None):
         """
         :param H_matrix: The Parity Check Matrix (M x N) in scipy.sparse.csr_matrix format.
         :param max_iterations: Maximum number of Belief Propagation iterations.
+        :param quantize_bits: If set (2-8), decode with int8 messages saturated to this
+                              many bits (scaled Min-Sum); otherwise use float32 messages.
         """
+        if quantize_bits is not None and not 2 <= quantize_bits <= 8:
+            raise ValueError("quantize_bits must be between 2 and 8.")
+            
         self.H = H_matrix
         self.M, self.N = H_matrix.shape
         self.max_iterations = max_iterations
+        self.quantize_bits = quantize_bits
         
         # Check for systematic structure (often requires preprocessing G matrix)
         self.K = self.N - self.M # Assumes full rank H
         
-        # Pre-process H for Numba kernel (CSR data)
-        self.H_rows = self.H.indptr
-        self.H_cols = self.H.indices
+        # Pre-process H for Numba kernel (CSR data: row pointers and per-edge column indices)
+        self.H_rows = np.ascontiguousarray(self.H.indptr, dtype=np.int32)
+        self.H_cols = np.ascontiguousarray(self.H.indices, dtype=np.int32)
         self.H_data = self.H.data # Data array (usually all ones for binary LDPC)
+        
+        # Column view (CSC) of the same edges, computed once: messages stay in CSR
+        # order and H_col_edges lists the CSR edge indices of each column
+        self.H_col_edges = np.argsort(self.H_cols, kind='stable').astype(np.int32)
+        self.H_col_ptr = np.zeros(self.N + 1, dtype=np.int32)
+        np.cumsum(np.bincount(self.H_cols, minlength=self.N), out=self.H_col_ptr[1:])
 
     def encode(self, data: np.ndarray) -> np.ndarray:
         """Encodes K data bits into N codeword bits (typically using Gaussian elimination on H)."""
@@ -102,27 +225,48 @@ class LDPCoder:
         # codeword = np.dot(data, self.G.toarray()) % 2
         return np.zeros(self.N, dtype=np.uint8)
 
-    def decode(self, llrs: np.ndarray, max_iterations: int = None) -> np.ndarray:
+    def decode(self, llrs: np.ndarray, max_iterations: int = None, out: np.ndarray = None) -> np.ndarray:
         """
         Performs soft-decision decoding using the Belief Propagation (BP) algorithm.
         
-        :param llrs: Received LLRs (size N).
+        :param llrs: Received LLRs (size N). Converted to float32 (no copy if already float32).
         :param max_iterations: Overrides class default max iterations.
+        :param out: Optional uint8 buffer (size N) that receives the decoded bits.
         :returns: Decoded hard bits (size N).
         """
+        if len(llrs) != self.N:
+            raise ValueError(f"Expected {self.N} LLRs, got {len(llrs)}")
         if max_iterations is None:
             max_iterations = self.max_iterations
+        if out is None:
+            out = np.empty(self.N, dtype=np.uint8)
+        elif out.shape != (self.N,) or out.dtype != np.uint8:
+            raise ValueError(f"Output buffer must be uint8 with length {self.N}")
 
         # Run the Numba JIT-compiled Belief Propagation kernel
-        decoded_codeword = _numba_ldpc_bp_kernel(
-            llrs, 
-            self.H_rows, 
-            self.H_cols, 
-            self.H_data, 
-            max_iterations
-        )
+        if self.quantize_bits is not None:
+            _numba_ldpc_bp_kernel_q(
+                quantize_llrs(llrs, self.quantize_bits),
+                self.H_rows,
+                self.H_cols,
+                self.H_col_ptr,
+                self.H_col_edges,
+                max_iterations,
+                (1 << (self.quantize_bits - 1)) - 1,
+                out
+            )
+        else:
+            _numba_ldpc_bp_kernel(
+                np.ascontiguousarray(llrs, dtype=np.float32), 
+                self.H_rows, 
+                self.H_cols, 
+                self.H_col_ptr, 
+                self.H_col_edges, 
+                max_iterations,
+                out
+            )
+        decoded_codeword = out
         
         # Extract information bits (assumes systematic form)
         # return decoded_codeword[:self.K]
         return decoded_codeword
-
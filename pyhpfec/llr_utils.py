@@ -13,27 +13,22 @@
 #
 
 import numpy as np
-from numba import njit, float64, uint8
+from numba import njit, float32, float64, void
 
 # --- Numba JIT-Compiled LLR Utilities ---
 
-@njit(uint8[:](float64[:]), cache=True)
 def llr_to_hard_bits(llrs: np.ndarray) -> np.ndarray:
     """
     Converts LLRs to hard decisions (0 or 1).
     LLR > 0 -> Bit 0 (more likely to be +1 symbol, which maps to bit 0)
     LLR < 0 -> Bit 1 (more likely to be -1 symbol, which maps to bit 1)
+    
+    Uses the sign bit directly (a single vectorized NumPy ufunc pass), so -0.0
+    maps to bit 1.
     """
-    # Equivalent to (llrs < 0).astype(np.uint8)
-    hard_bits = np.empty_like(llrs, dtype=uint8)
-    for i in range(len(llrs)):
-        if llrs[i] < 0.0:
-            hard_bits[i] = 1
-        else:
-            hard_bits[i] = 0
-    return hard_bits
+    return np.signbit(llrs).view(np.uint8)
 
-@njit(float64(float64, float64), cache=True)
+@njit([float64(float64, float64), float32(float32, float32)], cache=True)
 def log_map_approx(L_a: float, L_b: float) -> float:
     """
     Calculates log(e^La + e^Lb) using the Log-MAP approximation (often called Min-Sum).
@@ -41,19 +36,50 @@ def log_map_approx(L_a: float, L_b: float) -> float:
     Formula: log(e^La + e^Lb) = max(La, Lb) + log(1 + e^(-|La - Lb|))
     The Min-Sum approximation is: min(|La|, |Lb|)
     """
-    # Min-Sum Approximation (used in LDPC/Turbo Check Node Update for simplification)
-    abs_sum = np.abs(L_a + L_b)
-    abs_diff = np.abs(L_a - L_b)
+    # Min-Sum Approximation (used in LDPC/Turbo Check Node Update for simplification):
+    # the correction term is omitted, leaving sign(La) * sign(Lb) * min(|La|, |Lb|)
+    L_out = np.sign(L_a) * np.sign(L_b) * min(abs(L_a), abs(L_b))
+    return L_out
+
+# IEEE-754 single precision sign bit, as an int32 mask
+_SIGN_BIT_32 = np.int32(np.iinfo(np.int32).min)
+
+@njit(void(float32[:], float32[:], float32[:]), fastmath=True, cache=True)
+def log_map_approx_array(L_a: np.ndarray, L_b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Element-wise Min-Sum approximation of log_map_approx over float32 arrays.
     
-    # This is the exact Log-MAP calculation (requires look-up table or function for the correction term)
-    # The actual Min-Sum approximation is simply: np.sign(L_a) * np.sign(L_b) * np.min(np.abs(L_a), np.abs(L_b))
+    Branchless: the output sign is the XOR of the input sign bits and the
+    magnitude is min(|La|, |Lb|), combined with a bitwise OR, so the loop
+    compiles to plain vector min/xor/and/or instructions. Both inputs are
+    read before out[i] is written, so out may alias L_a or L_b.
     
-    # Using the standard approximate form (Min-Sum with sign):
-    L_out = np.sign(L_a) * np.sign(L_b) * np.min(np.abs(L_a), np.abs(L_b))
+    This is a standalone utility for pairwise check-node style updates; the
+    LDPC decoder has its own fused check-node kernel (ldpc._min_sum_check_node).
+    """
+    a_bits = L_a.view(np.int32)
+    b_bits = L_b.view(np.int32)
+    out_bits = out.view(np.int32)
+    for i in range(len(out)):
+        sign = (a_bits[i] ^ b_bits[i]) & _SIGN_BIT_32
+        out[i] = min(abs(L_a[i]), abs(L_b[i]))
+        out_bits[i] |= sign
+
+# Fractional bits of the fixed-point LLR format used by quantized decoders (Q4.3)
+LLR_FRAC_BITS = 3
+
+def quantize_llrs(llrs: np.ndarray, quantize_bits: int = 8, frac_bits: int = LLR_FRAC_BITS) -> np.ndarray:
+    """
+    Converts float LLRs to saturated fixed-point int8 values.
     
-    # Note: For high-performance, the correction term is often omitted, making the result the Min-Sum.
-    # We will return the result of the signs multiplied by the minimum of the magnitudes.
-    return L_out
+    :param llrs: Float LLRs.
+    :param quantize_bits: Total bits per LLR (sign included), at most 8.
+    :param frac_bits: Fractional bits (LLR scale is 2^frac_bits).
+    :returns: int8 LLRs clipped to +/-(2^(quantize_bits-1) - 1).
+    """
+    max_mag = (1 << (quantize_bits - 1)) - 1
+    scaled = np.rint(np.asarray(llrs) * (1 << frac_bits))
+    return np.clip(scaled, -max_mag, max_mag).astype(np.int8)
 
 # --- Class implementation is omitted as this file only contains utility functions ---
 
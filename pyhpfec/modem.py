@@ -13,34 +13,98 @@
 #
 
 import numpy as np
-from numba import njit, float64, uint8
+from numba import njit, prange, float64, int8, uint8, uint64, void
 
 # --- Numba JIT-Compiled Kernels ---
 
-@njit(float64[:](uint8[:]), cache=True)
-def _numba_bpsk_modulate(bits: np.ndarray) -> np.ndarray:
-    """BPSK modulation: maps bit 0 -> +1.0, bit 1 -> -1.0."""
-    return 1.0 - 2.0 * bits
-
-@njit(float64[:](float64[:], float64), cache=True)
-def _numba_bpsk_demodulate_llr(rx_symbols: np.ndarray, noise_variance: float) -> np.ndarray:
+def _build_bpsk_byte_lut() -> np.ndarray:
     """
-    BPSK Demodulation: Calculates LLRs for AWGN channel.
+    Builds the 256-entry BPSK symbol table for packed bits: entry b holds the
+    eight int8 symbols (+1/-1) of byte b (LSB first), viewed as one uint64 word.
     
-    LLR(b=0|y) = log(P(b=0|y) / P(b=1|y))
-    For AWGN: LLR approx (2 * y) / (sigma^2)
-    Assuming E_b = 1.0 (since symbol energy is 1.0), sigma^2 = N0/2.
-    LLR approx (4 * E_b / N0) * y = (2 / sigma^2) * y
+    The same word could come from PDEP (0x0101010101010101 ^ 0xFE *
+    rate_match._pdep_u64(b, 0x0101010101010101)), but the 2 KB table stays in
+    L1, costs one load per byte on every CPU, and avoids PDEP's microcoded
+    implementation on pre-Zen 3 AMD and the software fallback without BMI2.
+    """
+    bits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1, bitorder='little')
+    symbols = (1 - 2 * bits.astype(np.int8)).astype(np.int8)
+    return np.ascontiguousarray(symbols).view(np.uint64).ravel()
+
+_BPSK_BYTE_LUT = _build_bpsk_byte_lut()
+
+@njit(void(uint8[:], float64[:]), parallel=True, fastmath=True, cache=True)
+def _numba_bpsk_modulate(bits: np.ndarray, out: np.ndarray) -> None:
+    """
+    BPSK modulation: maps bit 0 -> +1.0, bit 1 -> -1.0.
+    Single fused pass writing straight into the preallocated out (no temporaries).
+    """
+    for i in prange(len(bits)):
+        out[i] = 1.0 - 2.0 * bits[i]
+
+@njit(void(uint8[:], uint64[:], int8[::1]), cache=True)
+def _numba_bpsk_modulate_packed(bits_packed: np.ndarray, byte_lut: np.ndarray, out: np.ndarray) -> None:
+    """
+    BPSK modulation of packed bits (8 per byte, LSB first) to int8 symbols.
+    Each full input byte is a single table load and a single 64-bit store of
+    its eight symbols; a trailing partial byte is written symbol by symbol.
+    """
+    n = len(out)
+    full = n >> 3
+    words = out[:full << 3].view(np.uint64)
+    for i in range(full):
+        words[i] = byte_lut[bits_packed[i]]
+    for j in range(full << 3, n):
+        out[j] = 1 - 2 * ((bits_packed[j >> 3] >> (j & 7)) & 1)
+
+# Kernels used by the classes: the ahead-of-time compiled ones (see _aot_build.py)
+# if built, the JIT kernels otherwise. The _numba_* names always stay the JIT
+# kernels, which _aot_build compiles from.
+try:
+    from .pyhpfec_kernels import bpsk_modulate as _bpsk_modulate
+    from .pyhpfec_kernels import bpsk_modulate_packed as _bpsk_modulate_packed
+except ImportError:
+    _bpsk_modulate = _numba_bpsk_modulate
+    _bpsk_modulate_packed = _numba_bpsk_modulate_packed
+
+# Smallest noise variance used for LLR scaling: sigma^2 = 0 (or a negative estimate)
+# takes the same branch-free path and gives a huge but finite scale. 1e-30 rather than
+# e.g. 1e-300 keeps the scaled LLRs finite after conversion to float32 (turbo decoder)
+_NOISE_VARIANCE_FLOOR = 1e-30
+
+def _llr_scale(noise_variance: float) -> float:
     """
-    # Assuming symbol energy is 1.0, N0 = noise_variance * 2
-    # LLR = (4 * E_b / N0) * y. Here, 4/N0 = 2/sigma^2.
+    BPSK LLR scale factor for an AWGN channel.
     
-    # If noise_variance (sigma^2) is 0, set to small epsilon to prevent division by zero.
-    if noise_variance == 0.0:
-        return 1e10 * rx_symbols # Very confident decision
-        
-    return (2.0 / noise_variance) * rx_symbols
+    LLR(b=0|y) = log(P(b=0|y) / P(b=1|y)) = (2 / sigma^2) * y,
+    assuming unit symbol energy (sigma^2 = N0/2, so 4 * E_b / N0 = 2 / sigma^2).
+    """
+    return 2.0 / max(noise_variance, _NOISE_VARIANCE_FLOOR)
 
+def modulate_packed(bits_packed: np.ndarray, n: int = None, out: np.ndarray = None) -> np.ndarray:
+    """
+    BPSK-modulates packed bits (8 per byte, LSB first, as produced by
+    np.packbits(..., bitorder='little')) to int8 symbols (+1/-1).
+    
+    The symbols stay int8 (8x smaller than float64) for fixed-point receivers;
+    upcast to float only at the channel boundary.
+    
+    :param bits_packed: Packed input bits (uint8).
+    :param n: Number of bits to modulate (defaults to len(out), or 8 * len(bits_packed)).
+    :param out: Optional contiguous int8 buffer of length n that receives the symbols.
+    :returns: The int8 symbols (out, if given).
+    """
+    bits_packed = np.ascontiguousarray(bits_packed, dtype=np.uint8)
+    if n is None:
+        n = len(out) if out is not None else 8 * len(bits_packed)
+    if n > 8 * len(bits_packed):
+        raise ValueError("n exceeds the number of packed bits")
+    if out is None:
+        out = np.empty(n, dtype=np.int8)
+    elif out.shape != (n,) or out.dtype != np.int8 or not out.flags.c_contiguous:
+        raise ValueError(f"Output buffer must be a contiguous int8 array of length {n}")
+    _bpsk_modulate_packed(bits_packed, _BPSK_BYTE_LUT, out)
+    return out
 
 # --- BPSK Modulator/Demodulator ---
 
@@ -50,36 +114,109 @@ class BPSKUnguided:
     Assumes unguided detection (channel state information is perfect/known).
     """
     
-    def modulate(self, bits: np.ndarray) -> np.ndarray:
+    def __init__(self):
+        # int8 symbol buffer of modulate_packed, sized to the last frame
+        self._sym_buf = np.empty(0, dtype=np.int8)
+    
+    def modulate(self, bits: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """
         Modulates input bits (0/1) to real symbols (+1/-1).
+        
+        :param bits: Input bits (uint8).
+        :param out: Optional float64 buffer of the same length that receives the symbols.
+        :returns: The modulated symbols (out, if given).
         """
-        return _numba_bpsk_modulate(bits)
+        bits = np.ascontiguousarray(bits, dtype=np.uint8)
+        if out is None:
+            out = np.empty(len(bits), dtype=np.float64)
+        elif out.shape != (len(bits),) or out.dtype != np.float64:
+            raise ValueError(f"Output buffer must be float64 with length {len(bits)}")
+        _bpsk_modulate(bits, out)
+        return out
 
-    def demodulate(self, rx_symbols: np.ndarray, noise_variance: float = 1.0) -> np.ndarray:
+    def modulate_packed(self, bits_packed: np.ndarray, n: int = None, out: np.ndarray = None) -> np.ndarray:
+        """
+        Modulates packed bits (8 per byte, LSB first, as produced by
+        np.packbits(..., bitorder='little')) to real symbols (+1/-1).
+        
+        The bits stay packed up to the BPSK expansion: they are expanded a byte at
+        a time to int8 symbols (see modulate_packed) in a reused buffer, and only
+        converted to float64 here, at the channel boundary.
+        
+        :param bits_packed: Packed input bits (uint8).
+        :param n: Number of bits to modulate (defaults to len(out), or 8 * len(bits_packed)).
+        :param out: Optional float64 buffer of length n that receives the symbols.
+        :returns: The modulated symbols (out, if given).
+        """
+        if n is None:
+            n = len(out) if out is not None else 8 * len(bits_packed)
+        if out is None:
+            out = np.empty(n, dtype=np.float64)
+        elif out.shape != (n,) or out.dtype != np.float64:
+            raise ValueError(f"Output buffer must be float64 with length {n}")
+        if len(self._sym_buf) != n:
+            self._sym_buf = np.empty(n, dtype=np.int8)
+        modulate_packed(bits_packed, out=self._sym_buf)
+        np.copyto(out, self._sym_buf)
+        return out
+
+    def demodulate(self, rx_symbols: np.ndarray, noise_variance: float = 1.0, out: np.ndarray = None) -> np.ndarray:
         """
         Demodulates received symbols to LLRs.
         
+        A single NumPy multiply (no JIT dispatch) computes the LLRs. Pass out to
+        reuse a buffer across frames instead of allocating a new result.
+        
         :param rx_symbols: Received real symbols.
         :param noise_variance: Noise variance (sigma^2) of the AWGN channel.
-        :returns: LLRs.
+        :param out: Optional float64 buffer of the same length that receives the LLRs.
+        :returns: LLRs (out, if given).
         """
-        return _numba_bpsk_demodulate_llr(rx_symbols, noise_variance)
+        if out is None:
+            out = np.empty(len(rx_symbols), dtype=np.float64)
+        return np.multiply(rx_symbols, _llr_scale(noise_variance), out=out)
 
-# --- QPSK Modulator/Demodulator (Placeholder) ---
+# --- QPSK Modulator/Demodulator ---
 
 class QPSKUnguided:
     """
     Quadrature Phase-Shift Keying (QPSK) Modulator and Demodulator.
+    Gray-coded with unit symbol energy: bit pair (b0, b1) maps to
+    ((1 - 2 * b0) + 1j * (1 - 2 * b1)) / sqrt(2), so each bit rides on one
+    quadrature and both directions are plain vectorized NumPy expressions.
     """
     
     def modulate(self, bits: np.ndarray) -> np.ndarray:
-        """Modulates pairs of bits to complex symbols."""
-        # Placeholder for QPSK logic
-        return np.zeros(len(bits) // 2, dtype=np.complex128)
-
-    def demodulate(self, rx_symbols: np.ndarray, noise_variance: float = 1.0) -> np.ndarray:
-        """Demodulates complex symbols to LLRs (size 2 * len(rx_symbols))."""
-        # Placeholder for QPSK LLR calculation
-        return np.zeros(len(rx_symbols) * 2, dtype=np.float64)
+        """
+        Modulates pairs of bits to complex symbols.
+        
+        :param bits: Input bits (uint8, even length).
+        :returns: Complex symbols (complex128, length len(bits) // 2).
+        """
+        if len(bits) % 2:
+            raise ValueError("QPSK needs an even number of bits")
+        pairs = bits.reshape(-1, 2)
+        symbols = np.empty(len(pairs), dtype=np.complex128)
+        np.subtract(1.0, 2.0 * pairs[:, 0], out=symbols.real)
+        np.subtract(1.0, 2.0 * pairs[:, 1], out=symbols.imag)
+        symbols *= 1.0 / np.sqrt(2.0)
+        return symbols
 
+    def demodulate(self, rx_symbols: np.ndarray, noise_variance: float = 1.0, out: np.ndarray = None) -> np.ndarray:
+        """
+        Demodulates complex symbols to LLRs (size 2 * len(rx_symbols)).
+        
+        With Gray mapping the LLR of each bit depends only on its own quadrature:
+        LLR = (2 / sqrt(2)) * y / sigma^2 for y the real (b0) or imaginary (b1) part.
+        
+        :param rx_symbols: Received complex symbols.
+        :param noise_variance: Noise variance (sigma^2) per real dimension.
+        :param out: Optional float64 buffer of length 2 * len(rx_symbols) that receives the LLRs.
+        :returns: LLRs, interleaved as [b0, b1, b0, b1, ...] like the modulator input.
+        """
+        if out is None:
+            out = np.empty(2 * len(rx_symbols), dtype=np.float64)
+        scale = _llr_scale(noise_variance) / np.sqrt(2.0)
+        np.multiply(rx_symbols.real, scale, out=out[0::2])
+        np.multiply(rx_symbols.imag, scale, out=out[1::2])
+        return out
@@ -13,55 +13,131 @@
 #
 
 import numpy as np
-from numba import njit
+import llvmlite.binding as llvm_binding
+from llvmlite import ir
+from numba import njit, float64, int32, uint64, void
+from numba.core import cgutils, types
+from numba.extending import intrinsic
+from .bit_utils import pack_bits
+
+# --- BMI2 Bit Gather/Scatter (PEXT/PDEP) ---
+
+# PEXT/PDEP are only emitted when the host CPU supports BMI2
+_HAS_BMI2 = bool(llvm_binding.get_host_cpu_features().get('bmi2', False))
+
+def _bmi2_intrinsic(llvm_name: str):
+    """Builds a numba intrinsic calling the 64-bit BMI2 instruction llvm_name."""
+    @intrinsic
+    def _bmi2_op(typingctx, src, mask):
+        sig = types.uint64(types.uint64, types.uint64)
+        def codegen(context, builder, signature, args):
+            fnty = ir.FunctionType(ir.IntType(64), [ir.IntType(64), ir.IntType(64)])
+            fn = cgutils.get_or_insert_function(builder.module, fnty, llvm_name)
+            return builder.call(fn, args)
+        return sig, codegen
+    return _bmi2_op
+
+_bmi2_pext = _bmi2_intrinsic("llvm.x86.bmi.pext.64")
+_bmi2_pdep = _bmi2_intrinsic("llvm.x86.bmi.pdep.64")
+
+@njit(uint64(uint64, uint64), cache=True)
+def _soft_pext(src: int, mask: int) -> int:
+    """Portable PEXT: gathers the bits of src selected by mask into the low bits."""
+    result = uint64(0)
+    out_bit = uint64(1)
+    while mask != 0:
+        if src & mask & (~mask + uint64(1)): # Lowest set bit of mask
+            result |= out_bit
+        out_bit <<= uint64(1)
+        mask &= mask - uint64(1)
+    return result
+
+@njit(uint64(uint64, uint64), cache=True)
+def _soft_pdep(src: int, mask: int) -> int:
+    """Portable PDEP: scatters the low bits of src to the positions set in mask."""
+    result = uint64(0)
+    in_bit = uint64(1)
+    while mask != 0:
+        if src & in_bit:
+            result |= mask & (~mask + uint64(1))
+        in_bit <<= uint64(1)
+        mask &= mask - uint64(1)
+    return result
+
+# Bit gather/scatter used by the kernels: the hardware instruction when
+# available, otherwise the portable loops (selected once, at import)
+if _HAS_BMI2:
+    _pext_u64, _pdep_u64 = _bmi2_pext, _bmi2_pdep
+else:
+    _pext_u64, _pdep_u64 = _soft_pext, _soft_pdep
 
 # --- Numba JIT-Compiled Rate Matching Kernels ---
 
-@njit
-def _numba_puncturing(codeword: np.ndarray, puncturing_pattern: np.ndarray) -> np.ndarray:
+@njit(int32(uint64[:], uint64[:], int32[:], uint64[:]), cache=True)
+def _numba_pext_puncture(codeword_u64: np.ndarray, masks: np.ndarray, mask_counts: np.ndarray, out: np.ndarray) -> int:
     """
-    Removes bits from the codeword according to a binary pattern (1=keep, 0=remove).
-    The pattern is usually repeated cyclically.
-    """
-    codeword_len = len(codeword)
-    pattern_len = len(puncturing_pattern)
-    
-    # Estimate max size for pre-allocation
-    max_output_len = codeword_len 
-    punctured_codeword = np.empty(max_output_len, dtype=codeword.dtype)
+    Punctures a bitpacked codeword (LSB first, see bit_utils.pack_bits): the bits of
+    word w selected by masks[w] are gathered with one PEXT and appended to the
+    packed output stream. out must be zeroed and hold the kept bits.
     
-    idx = 0
-    for i in range(codeword_len):
-        if puncturing_pattern[i % pattern_len] == 1:
-            punctured_codeword[idx] = codeword[i]
-            idx += 1
-            
-    return punctured_codeword[:idx] # Return the trimmed array
-
-@njit
-def _numba_depuncturing(received_llrs: np.ndarray, puncturing_pattern: np.ndarray, N: int, LLR_null: float = 0.0) -> np.ndarray:
+    :returns: Number of bits written to out.
     """
-    Inserts dummy LLRs (usually 0.0) back into the received LLR sequence 
-    where bits were punctured.
-    
-    :param N: The original length of the unpunctured codeword.
-    :param LLR_null: The LLR value used for punctured bits (0.0 means equal probability).
+    pos = 0
+    for w in range(len(masks)):
+        cnt = mask_counts[w]
+        if cnt == 0:
+            continue
+        kept = _pext_u64(codeword_u64[w], masks[w])
+        off = pos & 63
+        out[pos >> 6] |= kept << uint64(off)
+        if off + cnt > 64:
+            out[(pos >> 6) + 1] |= kept >> uint64(64 - off)
+        pos += cnt
+    return pos
+
+@njit(void(uint64[:], uint64[:], int32[:], uint64[:]), cache=True)
+def _numba_pdep_depuncture(received_u64: np.ndarray, masks: np.ndarray, mask_counts: np.ndarray, out: np.ndarray) -> None:
     """
-    received_len = len(received_llrs)
-    pattern_len = len(puncturing_pattern)
-    
-    depunctured_llrs = np.full(N, LLR_null, dtype=received_llrs.dtype)
+    Inverse of _numba_pext_puncture: the next mask_counts[w] bits of the packed
+    received stream are scattered to the kept positions of word w with one PDEP;
+    punctured positions are 0.
+    """
+    pos = 0
+    num_rx_words = len(received_u64)
+    for w in range(len(masks)):
+        cnt = mask_counts[w]
+        if cnt == 0:
+            out[w] = 0
+            continue
+        word = pos >> 6
+        off = pos & 63
+        chunk = received_u64[word] >> uint64(off)
+        if off + cnt > 64 and word + 1 < num_rx_words:
+            chunk |= received_u64[word + 1] << uint64(64 - off)
+        out[w] = _pdep_u64(chunk, masks[w]) # PDEP ignores source bits beyond cnt
+        pos += cnt
+
+@njit(void(float64[:], float64, int32[:], float64[:]), cache=True)
+def _numba_demod_depuncture(rx_symbols: np.ndarray, scale: float, keep_idx: np.ndarray, out: np.ndarray) -> None:
+    """
+    Fused BPSK demodulation and depuncturing: computes the LLR of every received
+    symbol (scale * y) and writes it straight to its unpunctured position
+    keep_idx[j] in out; punctured positions get 0.0. One pass over the data
+    instead of writing and re-reading an intermediate LLR array.
     
-    rx_idx = 0
-    for i in range(N):
-        if puncturing_pattern[i % pattern_len] == 1:
-            # This index was transmitted
-            if rx_idx < received_len:
-                depunctured_llrs[i] = received_llrs[rx_idx]
-                rx_idx += 1
-            # else: Should not happen if inputs are sized correctly
-            
-    return depunctured_llrs
+    The LLR scale (2 / sigma^2, with its zero-variance guard) is computed once
+    by the caller, so the loop body is a single multiply with no branch.
+    """
+    out[:] = 0.0
+    for j in range(min(len(rx_symbols), len(keep_idx))):
+        out[keep_idx[j]] = scale * rx_symbols[j]
+
+# Ahead-of-time compiled kernel (see _aot_build.py) if built, the JIT kernel
+# otherwise; _numba_demod_depuncture always stays the JIT kernel
+try:
+    from .pyhpfec_kernels import demod_depuncture as _demod_depuncture
+except ImportError:
+    _demod_depuncture = _numba_demod_depuncture
 
 # --- Rate Matcher Class ---
 
@@ -77,13 +153,73 @@ class RateMatcher:
         self.original_N = original_N
         self.target_N = target_N
         self.puncturing_pattern = puncturing_pattern
+        
+        # Codeword positions kept by the cyclically repeated pattern, so puncturing
+        # and depuncturing are a single gather/scatter with no per-bit modulo or branch
+        num_periods = -(-original_N // len(puncturing_pattern))
+        keep = np.tile(puncturing_pattern, num_periods)[:original_N] == 1
+        self._keep_idx_tx = np.nonzero(keep)[0].astype(np.int32)
+        
+        # The same pattern as one 64-bit keep mask per packed codeword word (PEXT/PDEP tiles)
+        self._tile_masks = pack_bits(keep.astype(np.uint8))
+        self._tile_counts = np.unpackbits(self._tile_masks.view(np.uint8)).reshape(-1, 64).sum(axis=1).astype(np.int32)
 
     def puncture(self, codeword: np.ndarray) -> np.ndarray:
-        """Applies puncturing."""
-        return _numba_puncturing(codeword, self.puncturing_pattern)
+        """Applies puncturing to a codeword of length original_N."""
+        return codeword[self._keep_idx_tx]
 
-    def depuncture(self, received_llrs: np.ndarray) -> np.ndarray:
-        """Applies depuncturing, inserting 0 LLRs for punctured positions."""
+    def depuncture(self, received_llrs: np.ndarray, LLR_null: float = 0.0) -> np.ndarray:
+        """
+        Applies depuncturing, inserting LLR_null (0.0 means equal probability)
+        for punctured positions.
+        """
         # Note: target_N is the length of the *unpunctured* codeword, which is the output size.
-        return _numba_depuncturing(received_llrs, self.puncturing_pattern, self.original_N)
+        depunctured_llrs = np.full(self.original_N, LLR_null, dtype=received_llrs.dtype)
+        num_rx = min(len(received_llrs), len(self._keep_idx_tx))
+        depunctured_llrs[self._keep_idx_tx[:num_rx]] = received_llrs[:num_rx]
+        return depunctured_llrs
+
+    def puncture_packed(self, codeword_u64: np.ndarray) -> np.ndarray:
+        """
+        Applies puncturing to a bitpacked codeword (see bit_utils.pack_bits).
+        
+        :param codeword_u64: Packed codeword of original_N bits (uint64).
+        :returns: The packed kept bits (uint64, len(_keep_idx_tx) bits).
+        """
+        if len(codeword_u64) != len(self._tile_masks):
+            raise ValueError(f"Packed codeword must have {len(self._tile_masks)} words")
+        out = np.zeros((len(self._keep_idx_tx) + 63) >> 6, dtype=np.uint64)
+        _numba_pext_puncture(codeword_u64, self._tile_masks, self._tile_counts, out)
+        return out
+
+    def depuncture_packed(self, received_u64: np.ndarray) -> np.ndarray:
+        """
+        Inverse of puncture_packed: punctured positions are filled with 0 bits.
+        
+        :param received_u64: Packed received bits (uint64).
+        :returns: The packed codeword of original_N bits (uint64).
+        """
+        num_rx_words = (len(self._keep_idx_tx) + 63) >> 6
+        if len(received_u64) < num_rx_words:
+            raise ValueError(f"Packed received bits must have at least {num_rx_words} words")
+        out = np.empty(len(self._tile_masks), dtype=np.uint64)
+        _numba_pdep_depuncture(received_u64, self._tile_masks, self._tile_counts, out)
+        return out
+
+    def demodulate_depuncture(self, rx_symbols: np.ndarray, scale: float, out: np.ndarray = None) -> np.ndarray:
+        """
+        Demodulates BPSK symbols and depunctures them in a single pass.
+        Equivalent to depuncture(scale * rx_symbols).
+        
+        :param rx_symbols: Received (punctured) real symbols.
+        :param scale: LLR scale factor (2 / sigma^2 for BPSK over AWGN).
+        :param out: Optional float64 buffer of length original_N that receives the LLRs.
+        :returns: Depunctured LLRs (out, if given).
+        """
+        if out is None:
+            out = np.empty(self.original_N, dtype=np.float64)
+        elif out.shape != (self.original_N,) or out.dtype != np.float64:
+            raise ValueError(f"Output buffer must be float64 with length {self.original_N}")
+        _demod_depuncture(np.ascontiguousarray(rx_symbols, dtype=np.float64), float(scale), self._keep_idx_tx, out)
+        return out
 
@@ -13,21 +13,283 @@
 #
 
 import numpy as np
-from numba import njit
+from typing import Callable
+from numba import njit, float32, int32, uint8, void
+from .llr_utils import llr_to_hard_bits
+from .modem import _llr_scale
 
-# --- Numba JIT-Compiled Component Decoders (Log-MAP/Max-Log-MAP) ---
+# --- Interleaver ---
 
-@njit(cache=True)
-def _numba_map_decoder_kernel(extrinsic_llrs: np.ndarray, received_llrs_sys: np.ndarray, received_llrs_par: np.ndarray, initial_state: np.ndarray) -> np.ndarray:
+def _create_interleaver(size: int, rsc_poly: tuple) -> np.ndarray:
     """
-    Core kernel for the constituent MAP decoder (e.g., Log-MAP or Max-Log-MAP).
-    Calculates forward (alpha) and backward (beta) metrics and then extrinsic LLRs.
+    Creates a pseudo-random or standard S-random interleaver map.
+    Shared by TurboEncoder and TurboDecoder so both sides use the same permutation.
+    Indices are int32 (half the footprint of int64 gather indices).
     """
-    # Placeholder for trellis structure, state, branch metrics, etc.
-    # This function is highly complex and depends on the specific Recursive Systematic Convolutional (RSC) code used.
+    # Placeholder: Using a simple identity or block interleaver for demonstration
+    return np.arange(size, dtype=np.int32)
+
+# --- RSC Trellis ---
+
+def _build_trellis(rsc_poly: tuple) -> tuple:
+    """
+    Builds the trellis of the recursive systematic convolutional (RSC) code.
+    
+    rsc_poly = (feedback, feedforward) in octal, MSB first (e.g. (0o7, 0o5)).
+    The state holds the last nu register values a_{t-1} .. a_{t-nu} (bit j-1 is
+    a_{t-j}), where a_t = u_t + sum_j fb_j * a_{t-j} and p_t = sum_j ff_j * a_{t-j}.
+    
+    :returns: (next_state, parity), both int32 arrays of shape (num_states, 2)
+              indexed by [state, input bit].
+    """
+    feedback, feedforward = rsc_poly
+    nu = max(int(feedback).bit_length(), int(feedforward).bit_length()) - 1
+    num_states = 1 << nu
+    next_state = np.empty((num_states, 2), dtype=np.int32)
+    parity = np.empty((num_states, 2), dtype=np.int32)
     
-    # Placeholder for output extrinsic LLRs
-    return np.zeros_like(extrinsic_llrs)
+    for state in range(num_states):
+        for u in range(2):
+            # Register contents a_{t-1} .. a_{t-nu} as coefficients of x^1 .. x^nu
+            a = u
+            for j in range(1, nu + 1):
+                a ^= ((feedback >> (nu - j)) & 1) & ((state >> (j - 1)) & 1)
+            p = ((feedforward >> nu) & 1) & a
+            for j in range(1, nu + 1):
+                p ^= ((feedforward >> (nu - j)) & 1) & ((state >> (j - 1)) & 1)
+            next_state[state, u] = ((state << 1) | a) & (num_states - 1)
+            parity[state, u] = p
+    return next_state, parity
+
+def _build_butterfly(next_state: np.ndarray, parity: np.ndarray) -> tuple:
+    """
+    Builds the gather/sign tables of the radix-2 trellis butterflies.
+    
+    Every RSC state has exactly two predecessors (one per value of the oldest
+    register bit), so each forward update reads two old state metrics.
+    
+    :returns: (par_sign, prev_state, prev_sys_sign, prev_par_sign), all of shape
+              (num_states, 2): the +/-1 parity sign of every [state, input bit]
+              branch, and the predecessor, input sign and parity sign of the
+              two branches entering every state.
+    """
+    num_states = next_state.shape[0]
+    par_sign = (1 - 2 * parity).astype(np.float32)
+    prev_state = np.empty((num_states, 2), dtype=np.int32)
+    prev_sys_sign = np.empty((num_states, 2), dtype=np.float32)
+    prev_par_sign = np.empty((num_states, 2), dtype=np.float32)
+    
+    num_prev = np.zeros(num_states, dtype=np.int32)
+    for state in range(num_states):
+        for u in range(2):
+            ns = next_state[state, u]
+            j = num_prev[ns]
+            prev_state[ns, j] = state
+            prev_sys_sign[ns, j] = 1 - 2 * u
+            prev_par_sign[ns, j] = par_sign[state, u]
+            num_prev[ns] += 1
+    if np.any(num_prev != 2):
+        raise ValueError("Trellis is not a radix-2 butterfly (check rsc_poly).")
+    return par_sign, prev_state, prev_sys_sign, prev_par_sign
+
+# --- Numba JIT-Compiled Component Encoders/Decoders (Max-Log-MAP) ---
+
+# Log-domain stand-in for -inf (unreachable states); finite to stay fastmath-safe.
+# Metrics and LLRs are float32; constants are float32 so no step promotes to float64
+_METRIC_NEG_INF = np.float32(-1e30)
+_HALF = np.float32(0.5)
+
+@njit(void(uint8[:], int32[:, :], int32[:, :], uint8[:]), cache=True)
+def _numba_rsc_encode(data: np.ndarray, next_state: np.ndarray, parity: np.ndarray, out: np.ndarray) -> None:
+    """Runs the RSC encoder from state 0 over data, writing the parity bits to out."""
+    state = 0
+    for t in range(len(data)):
+        u = data[t]
+        out[t] = parity[state, u]
+        state = next_state[state, u]
+
+@njit(void(float32[:], float32[:], float32[:], int32[:, :], float32[:, :], int32[:, :], float32[:, :], float32[:, :],
+            float32[:, :], float32[:, :], float32[:]), fastmath=True, cache=True)
+def _numba_map_decoder_kernel(extrinsic_llrs: np.ndarray, received_llrs_sys: np.ndarray, received_llrs_par: np.ndarray,
+                              next_state: np.ndarray, par_sign: np.ndarray, prev_state: np.ndarray,
+                              prev_sys_sign: np.ndarray, prev_par_sign: np.ndarray,
+                              alpha: np.ndarray, beta: np.ndarray, out: np.ndarray) -> None:
+    """
+    Core kernel for the constituent MAP decoder (Max-Log-MAP).
+    Calculates forward (alpha) and backward (beta) metrics and then extrinsic LLRs,
+    written to out (same length as extrinsic_llrs).
+    
+    LLRs are log(P(0) / P(1)). The trellis starts in state 0 and is not terminated.
+    alpha and beta are (k + 1, num_states) work buffers: alpha[t] is the
+    contiguous vector of all state metrics at step t, so every recursion step
+    and the final combine read and write whole state vectors with stride 1.
+    
+    Every state update is a radix-2 butterfly, max(m_a + gamma_a, m_b + gamma_b),
+    over the two trellis branches of the state. The branches come from gather
+    tables and gamma from +/-1 sign tables (see _build_butterfly), so the
+    per-state loops are branch-free and vectorize across states.
+    
+    :param extrinsic_llrs: A-priori LLRs of the information bits (extrinsic of the other decoder).
+    :param next_state: Trellis successor of [state, input bit] (see _build_trellis).
+    :param par_sign: +1/-1 for parity 0/1 of [state, input bit].
+    :param prev_state: The two trellis predecessors of each state.
+    :param prev_sys_sign: +1/-1 for the input bit 0/1 of each predecessor branch.
+    :param prev_par_sign: +1/-1 for the parity 0/1 of each predecessor branch.
+    """
+    k = len(extrinsic_llrs)
+    num_states = next_state.shape[0]
+    
+    # --- Forward recursion ---
+    alpha[0, :] = _METRIC_NEG_INF
+    alpha[0, 0] = 0.0
+    for t in range(k):
+        # Branch metric halves: +/- L/2 for bit value 0/1
+        g_sys = _HALF * (extrinsic_llrs[t] + received_llrs_sys[t])
+        g_par = _HALF * received_llrs_par[t]
+        for s in range(num_states):
+            a0 = alpha[t, prev_state[s, 0]] + prev_sys_sign[s, 0] * g_sys + prev_par_sign[s, 0] * g_par
+            a1 = alpha[t, prev_state[s, 1]] + prev_sys_sign[s, 1] * g_sys + prev_par_sign[s, 1] * g_par
+            alpha[t + 1, s] = max(a0, a1)
+        # Normalize against state 0 to keep metrics bounded
+        norm = alpha[t + 1, 0]
+        for s in range(num_states):
+            alpha[t + 1, s] -= norm
+    
+    # --- Backward recursion (unterminated: all end states equally likely) ---
+    beta[k, :] = 0.0
+    for t in range(k - 1, -1, -1):
+        g_sys = _HALF * (extrinsic_llrs[t] + received_llrs_sys[t])
+        g_par = _HALF * received_llrs_par[t]
+        for s in range(num_states):
+            b0 = beta[t + 1, next_state[s, 0]] + g_sys + par_sign[s, 0] * g_par
+            b1 = beta[t + 1, next_state[s, 1]] - g_sys + par_sign[s, 1] * g_par
+            beta[t, s] = max(b0, b1)
+        norm = beta[t, 0]
+        for s in range(num_states):
+            beta[t, s] -= norm
+    
+    # --- LLR combine: only the parity part of gamma differs between states ---
+    for t in range(k):
+        g_par = _HALF * received_llrs_par[t]
+        m0 = _METRIC_NEG_INF
+        m1 = _METRIC_NEG_INF
+        for s in range(num_states):
+            a = alpha[t, s]
+            m0 = max(m0, a + beta[t + 1, next_state[s, 0]] + par_sign[s, 0] * g_par)
+            m1 = max(m1, a + beta[t + 1, next_state[s, 1]] + par_sign[s, 1] * g_par)
+        # Extrinsic = full LLR minus the a-priori and systematic contributions
+        out[t] = m0 - m1
+
+@njit(void(float32[:, :], float32[:, :], float32[:, :], int32[:, :], float32[:, :], int32[:, :], float32[:, :], float32[:, :],
+            float32[:, :, :], float32[:, :, :], float32[:, :]), fastmath=True, cache=True)
+def _numba_map_decoder_kernel_batch(extrinsic_llrs: np.ndarray, received_llrs_sys: np.ndarray, received_llrs_par: np.ndarray,
+                                    next_state: np.ndarray, par_sign: np.ndarray, prev_state: np.ndarray,
+                                    prev_sys_sign: np.ndarray, prev_par_sign: np.ndarray,
+                                    alpha: np.ndarray, beta: np.ndarray, out: np.ndarray) -> None:
+    """
+    Inter-frame variant of _numba_map_decoder_kernel: decodes B frames at once,
+    one frame per lane. All LLR arrays are (k, B) and alpha/beta are
+    (k + 1, num_states, B), so the innermost loop of every butterfly runs over
+    the B independent frames with stride 1 and no cross-lane dependency.
+    """
+    k, B = extrinsic_llrs.shape
+    num_states = next_state.shape[0]
+    m0 = np.empty(B, dtype=np.float32)
+    m1 = np.empty(B, dtype=np.float32)
+    # Per-lane branch metric halves of step t, computed once per step (not per state)
+    g_sys = np.empty(B, dtype=np.float32)
+    g_par = np.empty(B, dtype=np.float32)
+    
+    # --- Forward recursion ---
+    alpha[0, :, :] = _METRIC_NEG_INF
+    alpha[0, 0, :] = 0.0
+    for t in range(k):
+        for b in range(B):
+            g_sys[b] = _HALF * (extrinsic_llrs[t, b] + received_llrs_sys[t, b])
+            g_par[b] = _HALF * received_llrs_par[t, b]
+        for s in range(num_states):
+            p0 = prev_state[s, 0]
+            p1 = prev_state[s, 1]
+            for b in range(B):
+                a0 = alpha[t, p0, b] + prev_sys_sign[s, 0] * g_sys[b] + prev_par_sign[s, 0] * g_par[b]
+                a1 = alpha[t, p1, b] + prev_sys_sign[s, 1] * g_sys[b] + prev_par_sign[s, 1] * g_par[b]
+                alpha[t + 1, s, b] = max(a0, a1)
+        # Normalize every lane against its state 0
+        for s in range(1, num_states):
+            for b in range(B):
+                alpha[t + 1, s, b] -= alpha[t + 1, 0, b]
+        alpha[t + 1, 0, :] = 0.0
+    
+    # --- Backward recursion (unterminated: all end states equally likely) ---
+    beta[k, :, :] = 0.0
+    for t in range(k - 1, -1, -1):
+        for b in range(B):
+            g_sys[b] = _HALF * (extrinsic_llrs[t, b] + received_llrs_sys[t, b])
+            g_par[b] = _HALF * received_llrs_par[t, b]
+        for s in range(num_states):
+            n0 = next_state[s, 0]
+            n1 = next_state[s, 1]
+            for b in range(B):
+                b0 = beta[t + 1, n0, b] + g_sys[b] + par_sign[s, 0] * g_par[b]
+                b1 = beta[t + 1, n1, b] - g_sys[b] + par_sign[s, 1] * g_par[b]
+                beta[t, s, b] = max(b0, b1)
+        for s in range(1, num_states):
+            for b in range(B):
+                beta[t, s, b] -= beta[t, 0, b]
+        beta[t, 0, :] = 0.0
+    
+    # --- LLR combine ---
+    for t in range(k):
+        m0[:] = _METRIC_NEG_INF
+        m1[:] = _METRIC_NEG_INF
+        for b in range(B):
+            g_par[b] = _HALF * received_llrs_par[t, b]
+        for s in range(num_states):
+            n0 = next_state[s, 0]
+            n1 = next_state[s, 1]
+            for b in range(B):
+                a = alpha[t, s, b]
+                m0[b] = max(m0[b], a + beta[t + 1, n0, b] + par_sign[s, 0] * g_par[b])
+                m1[b] = max(m1[b], a + beta[t + 1, n1, b] + par_sign[s, 1] * g_par[b])
+        for b in range(B):
+            out[t, b] = m0[b] - m1[b]
+
+# --- Specialized Component Decoders (generated per trellis) ---
+
+# Compiled MAP kernels keyed by (num_states, next_state, parity), shared by all decoders
+_MAP_KERNELS = {}
+
+# The Max-Log-MAP body, inlined into every specialized kernel
+_map_decoder_core = njit(inline='always', fastmath=True)(_numba_map_decoder_kernel.py_func)
+
+def _build_map_kernel(next_state: np.ndarray, parity: np.ndarray):
+    """
+    Returns a Max-Log-MAP kernel specialized for one RSC trellis.
+    
+    The trellis and butterfly tables are closure constants of the compiled
+    function, so the number of states and every gather index and branch sign
+    are known at compile time and LLVM fully unrolls the per-state loops.
+    
+    :param next_state: Trellis successor of [state, input bit] (see _build_trellis).
+    :param parity: Parity output of [state, input bit].
+    :returns: A compiled kernel(extrinsic_llrs, received_llrs_sys, received_llrs_par,
+              alpha, beta, out) with the semantics of _numba_map_decoder_kernel.
+    """
+    key = (next_state.shape[0], tuple(next_state.ravel()), tuple(parity.ravel()))
+    kernel = _MAP_KERNELS.get(key)
+    if kernel is not None:
+        return kernel
+    
+    trellis_next = next_state.copy()
+    par_sign, prev_state, prev_sys_sign, prev_par_sign = _build_butterfly(next_state, parity)
+    
+    @njit(void(float32[:], float32[:], float32[:], float32[:, :], float32[:, :], float32[:]), fastmath=True)
+    def _map_kernel_specialized(extrinsic_llrs, received_llrs_sys, received_llrs_par, alpha, beta, out):
+        _map_decoder_core(extrinsic_llrs, received_llrs_sys, received_llrs_par, trellis_next, par_sign,
+                          prev_state, prev_sys_sign, prev_par_sign, alpha, beta, out)
+    
+    _MAP_KERNELS[key] = _map_kernel_specialized
+    return _map_kernel_specialized
 
 # --- Turbo Encoder ---
 
@@ -41,22 +303,29 @@ class TurboEncoder:
         """
         self.k = k
         self.rsc_poly = rsc_poly
-        self.interleaver = self._create_interleaver(interleaver_size if interleaver_size else k)
-        
-    def _create_interleaver(self, size: int) -> np.ndarray:
-        """Creates a pseudo-random or standard S-random interleaver map."""
-        # Placeholder: Using a simple identity or block interleaver for demonstration
-        return np.arange(size)
+        self.interleaver = _create_interleaver(interleaver_size if interleaver_size else k, rsc_poly)
+        self.next_state, self.parity = _build_trellis(rsc_poly)
 
     def encode(self, data: np.ndarray) -> np.ndarray:
-        """Encodes data using two parallel RSC encoders and a fixed interleaver."""
+        """
+        Encodes data using two parallel RSC encoders and a fixed interleaver.
+        
+        :param data: Data bits (uint8, shape (k,)).
+        :returns: The rate-1/3 codeword [Data | Parity1 | Parity2] (uint8, shape (3k,)).
+        """
+        data = np.ascontiguousarray(data, dtype=np.uint8)
+        codeword = np.empty(3 * self.k, dtype=np.uint8)
+        
         # 1. First RSC Encoder (input: data) -> systematic (data) + parity1
+        codeword[:self.k] = data
+        _numba_rsc_encode(data, self.next_state, self.parity, codeword[self.k:2 * self.k])
+        
         # 2. Interleave data -> interleaved_data
         # 3. Second RSC Encoder (input: interleaved_data) -> parity2
-        # Codeword = [Data | Punctured Parity1 | Punctured Parity2]
+        _numba_rsc_encode(data[self.interleaver], self.next_state, self.parity, codeword[2 * self.k:])
         
-        # Placeholder for full encoded output
-        return np.zeros(self.k * 3, dtype=np.uint8)
+        # Puncturing, if any, is applied afterwards by a RateMatcher
+        return codeword
 
 # --- Turbo Decoder ---
 
@@ -66,21 +335,47 @@ class TurboDecoder:
     and exchanges extrinsic information.
     """
     
-    def __init__(self, k: int, rsc_poly: tuple = (0o7, 0o5), interleaver_size: int = None, max_iterations: int = 8):
+    def __init__(self, k: int, rsc_poly: tuple = (0o7, 0o5), interleaver_size: int = None, max_iterations: int = 8,
+                 crc_check: Callable[[np.ndarray], bool] = None):
         """
         :param k: Data length.
         :param rsc_poly: Generator polynomials for the RSC encoders.
         :param max_iterations: Maximum number of decoding iterations.
+        :param crc_check: Optional stopping criterion, called with the hard decisions
+                          (uint8, shape (k,)) after every iteration; decoding stops
+                          as soon as it returns True (e.g. the frame CRC matches).
         """
         self.k = k
         self.max_iterations = max_iterations
+        self.crc_check = crc_check
         self.rsc_poly = rsc_poly
-        self.interleaver = TurboEncoder(k=k, rsc_poly=rsc_poly, interleaver_size=interleaver_size).interleaver
-        self.deinterleaver = np.argsort(self.interleaver)
+        interleaver = _create_interleaver(interleaver_size if interleaver_size else k, rsc_poly)
+        # Permutation and its inverse as int32 gather indices; the inverse of a
+        # permutation is a single O(k) scatter, no sort needed
+        self.interleaver = interleaver
+        self.deinterleaver = np.empty_like(interleaver)
+        self.deinterleaver[interleaver] = np.arange(len(interleaver), dtype=interleaver.dtype)
+        self.next_state, self.parity = _build_trellis(rsc_poly)
+        self._butterfly = _build_butterfly(self.next_state, self.parity)
+        # Single-frame MAP kernel compiled for this trellis (shared with other decoders of the same code)
+        self._map_kernel = _build_map_kernel(self.next_state, self.parity)
+        
+        # Per-frame work buffers, reused by every iteration (filled in place via out=).
+        # Decoding runs in float32 (twice the SIMD width of float64, half the footprint);
+        # only the depunctured channel LLRs of decode_symbols stay float64
+        self._llrs = np.empty(3 * k)
+        self._llrs_f32 = np.empty(3 * k, dtype=np.float32)
+        (self._L_e1, self._L_e2, self._L_a2, self._L_e2_interleaved,
+         self._R_sys_interleaved, self._L_final) = [np.empty(k, dtype=np.float32) for _ in range(6)]
+        # Forward/backward state metrics, shared by both constituent decoders
+        self._alpha = np.empty((k + 1, self.next_state.shape[0]), dtype=np.float32)
+        self._beta = np.empty((k + 1, self.next_state.shape[0]), dtype=np.float32)
+        # Work buffers of decode_batch, (re)allocated for the last batch size
+        self._batch_size = 0
 
     def decode(self, llrs: np.ndarray, max_iterations: int = None) -> np.ndarray:
         """
-        Performs iterative decoding using the BCJR/Log-MAP algorithm.
+        Performs iterative decoding using the BCJR/Max-Log-MAP algorithm.
         
         :param llrs: Received Log-Likelihood Ratios (LLRs) for systematic and parity bits.
         :param max_iterations: Overrides class default max iterations.
@@ -89,31 +384,127 @@ class TurboDecoder:
         if max_iterations is None:
             max_iterations = self.max_iterations
             
-        # Split LLRs into systematic, parity1, and parity2
-        R_sys, R_p1, R_p2 = self._split_llrs(llrs)
+        # Split LLRs into systematic, parity1, and parity2 (converted to float32 in place)
+        self._llrs_f32[:] = llrs
+        R_sys, R_p1, R_p2 = self._split_llrs(self._llrs_f32)
+        
+        # The interleaved systematic LLRs do not change across iterations
+        R_sys_interleaved = np.take(R_sys, self.interleaver, out=self._R_sys_interleaved)
         
         # Initialize extrinsic LLRs (A_priori from one decoder is Extrinsic from the other)
-        L_e1 = np.zeros(self.k)
-        L_e2 = np.zeros(self.k)
+        L_e1 = self._L_e1
+        L_e2 = self._L_e2
+        L_e1[:] = 0.0
+        L_e2[:] = 0.0
         
         for i in range(max_iterations):
             # 1. Decoder 1 (Uninterleaved)
-            L_a1 = L_e2[self.deinterleaver] # A-priori LLR is deinterleaved extrinsic from D2
-            L_e1_uninterleaved = _numba_map_decoder_kernel(L_a1, R_sys, R_p1, None) # Placeholder
-            L_e1 = L_e1_uninterleaved # Extrinsic LLRs from D1
+            # A-priori LLR is the extrinsic from D2, already deinterleaved
+            self._map_kernel(L_e2, R_sys, R_p1, self._alpha, self._beta, L_e1) # Extrinsic LLRs from D1
             
             # 2. Decoder 2 (Interleaved)
-            L_a2 = L_e1[self.interleaver] # A-priori LLR is interleaved extrinsic from D1
-            R_sys_interleaved = R_sys[self.interleaver]
+            L_a2 = np.take(L_e1, self.interleaver, out=self._L_a2) # A-priori LLR is interleaved extrinsic from D1
             
-            L_e2_interleaved = _numba_map_decoder_kernel(L_a2, R_sys_interleaved, R_p2, None) # Placeholder
-            L_e2 = L_e2_interleaved[self.deinterleaver] # Deinterleave the extrinsic LLRs
+            self._map_kernel(L_a2, R_sys_interleaved, R_p2, self._alpha, self._beta, self._L_e2_interleaved)
+            np.take(self._L_e2_interleaved, self.deinterleaver, out=L_e2) # Deinterleave the extrinsic LLRs
             
-            # 3. Final LLRs (for decision)
-            L_final = R_sys + L_e1 + L_e2 
+            # Early termination once the frame checks out
+            if self.crc_check is not None and i < max_iterations - 1:
+                hard_bits = self._hard_decision(R_sys, L_e1, L_e2, self._L_final)
+                if self.crc_check(hard_bits):
+                    return hard_bits
             
+        # 3. Final LLRs (for decision)
+        return self._hard_decision(R_sys, L_e1, L_e2, self._L_final)
+
+    @staticmethod
+    def _hard_decision(R_sys: np.ndarray, L_e1: np.ndarray, L_e2: np.ndarray, L_final: np.ndarray) -> np.ndarray:
+        """Hard decisions on the a-posteriori LLRs R_sys + L_e1 + L_e2 (summed into L_final)."""
+        np.add(R_sys, L_e1, out=L_final)
+        L_final += L_e2
         return llr_to_hard_bits(L_final)
 
+    def _alloc_batch_buffers(self, B: int) -> None:
+        """Allocates the lane-major (k, B) work buffers of decode_batch."""
+        k = self.k
+        num_states = self.next_state.shape[0]
+        (self._Lb_e1, self._Lb_e2, self._Lb_a2, self._Lb_e2_interleaved,
+         self._Rb_sys_interleaved, self._Lb_final) = [np.empty((k, B), dtype=np.float32) for _ in range(6)]
+        self._alpha_b = np.empty((k + 1, num_states, B), dtype=np.float32)
+        self._beta_b = np.empty((k + 1, num_states, B), dtype=np.float32)
+        self._batch_size = B
+
+    def decode_batch(self, llrs: np.ndarray, max_iterations: int = None) -> np.ndarray:
+        """
+        Decodes B frames together, one frame per lane of the MAP kernel
+        (see _numba_map_decoder_kernel_batch). Equivalent to calling decode on
+        every row, but the trellis recursions run over all frames at once.
+        
+        :param llrs: Received LLRs, shape (B, 3k), one frame per row.
+        :param max_iterations: Overrides class default max iterations.
+        :returns: Decoded hard bits, shape (B, k).
+        """
+        if max_iterations is None:
+            max_iterations = self.max_iterations
+        if llrs.ndim != 2 or llrs.shape[1] != 3 * self.k:
+            raise ValueError(f"Input LLRs must have shape (B, {3 * self.k})")
+        
+        B = llrs.shape[0]
+        if B != self._batch_size:
+            self._alloc_batch_buffers(B)
+        
+        # Lane-major layout: row t holds position t of every frame
+        llrs_lanes = np.ascontiguousarray(llrs.T, dtype=np.float32)
+        R_sys, R_p1, R_p2 = self._split_llrs(llrs_lanes)
+        R_sys_interleaved = np.take(R_sys, self.interleaver, axis=0, out=self._Rb_sys_interleaved)
+        
+        L_e1 = self._Lb_e1
+        L_e2 = self._Lb_e2
+        L_e1[:] = 0.0
+        L_e2[:] = 0.0
+        
+        # With a CRC, lanes that pass keep the decisions of that iteration
+        decided = np.empty((B, self.k), dtype=np.uint8)
+        active = np.ones(B, dtype=bool)
+        
+        for i in range(max_iterations):
+            _numba_map_decoder_kernel_batch(L_e2, R_sys, R_p1, self.next_state, *self._butterfly,
+                                            self._alpha_b, self._beta_b, L_e1)
+            L_a2 = np.take(L_e1, self.interleaver, axis=0, out=self._Lb_a2)
+            _numba_map_decoder_kernel_batch(L_a2, R_sys_interleaved, R_p2, self.next_state, *self._butterfly,
+                                            self._alpha_b, self._beta_b, self._Lb_e2_interleaved)
+            np.take(self._Lb_e2_interleaved, self.deinterleaver, axis=0, out=L_e2)
+            
+            # Per-lane early termination; stop once every frame has passed
+            if self.crc_check is not None and i < max_iterations - 1:
+                hard_bits = self._hard_decision(R_sys, L_e1, L_e2, self._Lb_final).T
+                for b in np.nonzero(active)[0]:
+                    if self.crc_check(hard_bits[b]):
+                        decided[b] = hard_bits[b]
+                        active[b] = False
+                if not active.any():
+                    return decided
+        
+        hard_bits = self._hard_decision(R_sys, L_e1, L_e2, self._Lb_final).T
+        decided[active] = hard_bits[active]
+        return decided
+
+    def decode_symbols(self, rx_symbols: np.ndarray, noise_variance: float, rate_matcher, max_iterations: int = None) -> np.ndarray:
+        """
+        Decodes received BPSK symbols directly. Demodulation and depuncturing
+        run as one fused pass (see RateMatcher.demodulate_depuncture).
+        
+        :param rx_symbols: Received (punctured) real symbols.
+        :param noise_variance: Noise variance (sigma^2) of the AWGN channel.
+        :param rate_matcher: RateMatcher used at the transmitter (original_N = 3k).
+        :param max_iterations: Overrides class default max iterations.
+        :returns: Decoded hard bits.
+        """
+        # The LLR scale is computed once per frame here, not per symbol in the kernel
+        scale = _llr_scale(noise_variance)
+        llrs = rate_matcher.demodulate_depuncture(rx_symbols, scale, out=self._llrs)
+        return self.decode(llrs, max_iterations)
+
     def _split_llrs(self, llrs: np.ndarray) -> tuple:
         """Splits the received LLR array into systematic, parity1, and parity2 components."""
         # Assumes a specific puncturing scheme for splitting
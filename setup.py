@@ -22,6 +22,16 @@
 
 from setuptools import setup, find_packages
 import os
+import sys
+
+# Optional ahead-of-time compiled kernels (pyhpfec/_aot_build.py); the package
+# falls back to numba JIT compilation when the extension cannot be set up
+try:
+    from pyhpfec._aot_build import cc
+    ext_modules = [cc.distutils_extension()]
+except Exception as exc:
+    print(f"pyhpfec: skipping AOT kernels ({exc})", file=sys.stderr)
+    ext_modules = []
 
 # Utility function to read the README file for long description
 def read(fname):
@@ -39,6 +49,7 @@ setup(
     
     # Automatically find all packages in the 'pyhpfec' directory
     packages=find_packages(include=['pyhpfec', 'pyhpfec.*']), 
+    ext_modules=ext_modules,
     
     # Define dependencies. Numba is critical.
     install_requires=[
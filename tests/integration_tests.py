@@ -80,8 +80,8 @@ class TestEndToEndCoding(unittest.TestCase):
         channel = AWGNChannel(EbNo_dB=EbNo_dB)
         
         tx_symbols = self.modem.modulate(codeword)
-        rx_symbols = channel.transmit(tx_symbols, k=self.k, n=self.n)
-        llrs = self.modem.demodulate(rx_symbols)
+        rx = channel.transmit(tx_symbols, k=self.k, n=self.n)
+        llrs = self.modem.demodulate(rx.symbols, rx.noise_variance)
         
         # Use Chase soft-decision decoding
         # Setting a small number of test patterns for speed, but this requires a robust decoder.
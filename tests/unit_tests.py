@@ -19,11 +19,39 @@
 
 # Copyright (C) 2025 Kris Kirby
 
+import glob
+import importlib.util
+import math
+import shutil
+import tempfile
 import numpy as np
 import unittest
-from pyhpfec.config import GFContext, gf_multiply, gf_inverse
-from pyhpfec.cyclic import BCHGolayCoder
-from pyhpfec.llr_utils import llr_to_hard_bits, log_map_approx
+from unittest import mock
+from pyhpfec.config import GFContext, gf_multiply, gf_inverse, gf_log_add, gf_region_multiply
+from pyhpfec.bit_utils import pack_bits, unpack_bits
+from pyhpfec.cyclic import BCHGolayCoder, _numba_chase_pattern_metrics
+from pyhpfec.llr_utils import llr_to_hard_bits, log_map_approx, log_map_approx_array
+from pyhpfec.ldpc import LDPCoder
+from pyhpfec import modem, rate_match
+from pyhpfec.modem import BPSKUnguided, QPSKUnguided, modulate_packed
+from pyhpfec.rate_match import RateMatcher, _soft_pext, _soft_pdep
+from pyhpfec.channel import AWGNChannel, RxBlock
+from pyhpfec.turbo import TurboEncoder, TurboDecoder, _numba_map_decoder_kernel
+from scipy.sparse import csr_matrix
+
+def _reference_cyclic_encode(data: np.ndarray, generator: np.ndarray) -> np.ndarray:
+    """
+    Reference systematic cyclic encoder: bit-by-bit long division of
+    [data | 0] by g(x) (lowest degree first); the remainder is the parity.
+    """
+    k = len(data)
+    frame = np.zeros(k + len(generator) - 1, dtype=np.uint8)
+    frame[:k] = data
+    for i in range(k):
+        if frame[i]:
+            frame[i:i + len(generator)] ^= generator
+    frame[:k] = data
+    return frame
 
 class TestGFArithmetic(unittest.TestCase):
     """Tests for Galois Field operations defined in config.py."""
@@ -57,6 +85,45 @@ class TestGFArithmetic(unittest.TestCase):
         # Test that 0 has no inverse
         self.assertEqual(gf_inverse(0, self.ctx.inv_table), 0)
 
+    def test_gf_log_add(self):
+        # Addition in log form must agree with XOR of the elements (including zero)
+        for a in range(self.Q):
+            for b in range(self.Q):
+                log_sum = gf_log_add(int(self.log_table[a]), int(self.log_table[b]), self.ctx.zech_table, self.Q)
+                self.assertEqual(log_sum, self.log_table[a ^ b])
+
+    def test_gf_region_multiply(self):
+        # In-place region scaling must agree with element-wise gf_multiply, including zeros
+        for c in (0, 1, 7):
+            region = np.arange(self.Q, dtype=np.uint8)
+            gf_region_multiply(region, c, self.log_table, self.anti_log_table, self.M)
+            for a in range(self.Q):
+                self.assertEqual(region[a], gf_multiply(a, c, self.log_table, self.anti_log_table, self.M))
+
+    def test_largest_field(self):
+        # GF(2^8) is the largest supported field: the log(0) sentinel must fit
+        # the log table and the table lookups must match carry-less multiplication
+        ctx = GFContext(M=8)
+        self.assertEqual(int(ctx.log_table[0]), 2 * ctx.Q - 3)
+        def reference_multiply(a, b):
+            product = 0
+            while b:
+                if b & 1:
+                    product ^= a
+                b >>= 1
+                a <<= 1
+                if a & ctx.Q:
+                    a ^= ctx.P_poly
+            return product
+        rng = np.random.default_rng(8)
+        for a, b in rng.integers(0, ctx.Q, (200, 2)):
+            a, b = int(a), int(b)
+            self.assertEqual(gf_multiply(a, b, ctx.log_table, ctx.anti_log_table, ctx.M), reference_multiply(a, b))
+            log_sum = gf_log_add(int(ctx.log_table[a]), int(ctx.log_table[b]), ctx.zech_table, ctx.Q)
+            self.assertEqual(log_sum, ctx.log_table[a ^ b])
+        with self.assertRaises(ValueError):
+            GFContext(M=9)
+
 class TestBCHKernels(unittest.TestCase):
     """Tests for core BCH encoding and syndrome calculation kernels."""
 
@@ -72,7 +139,40 @@ class TestBCHKernels(unittest.TestCase):
         data = np.zeros(self.k, dtype=np.uint8)
         codeword = self.coder.encode(data)
         self.assertTrue(np.all(codeword == 0))
-        
+
+    def test_encoding_valid_codeword(self):
+        # Every encoded codeword is a multiple of g(x), so all syndromes vanish
+        data = np.array([1, 0, 1, 1, 0, 0, 1], dtype=np.uint8)
+        codeword = self.coder.encode(data)
+        self.assertEqual(codeword.shape, (self.n,))
+        self.assertTrue(np.array_equal(codeword[:self.k], data))
+        self.assertTrue(np.all(self.coder._calculate_syndromes(codeword) == 0))
+
+    def test_encode_batch_matches_encode(self):
+        data = np.random.randint(0, 2, (8, self.k), dtype=np.uint8)
+        codewords = self.coder.encode_batch(data)
+        for row, codeword in zip(data, codewords):
+            self.assertTrue(np.array_equal(codeword, self.coder.encode(row)))
+
+    def test_encode_into_out(self):
+        # Encodes in place into a caller buffer; wrong shape or dtype is rejected
+        data = np.random.randint(0, 2, self.k, dtype=np.uint8)
+        out = np.empty(self.n, dtype=np.uint8)
+        self.assertIs(self.coder.encode(data, out=out), out)
+        self.assertTrue(np.array_equal(out, self.coder.encode(data)))
+        with self.assertRaises(ValueError):
+            self.coder.encode(data, out=np.empty(self.n - 1, dtype=np.uint8))
+        with self.assertRaises(ValueError):
+            self.coder.encode(data, out=np.empty(self.n, dtype=np.int32))
+
+    def test_specialized_encoder_matches_generic(self):
+        # The generated encoder must agree with reference long division and be shared per code
+        data = np.random.randint(0, 2, self.k, dtype=np.uint8)
+        expected = _reference_cyclic_encode(data, self.coder.generator_poly)
+        self.assertTrue(np.array_equal(self.coder.encode(data), expected))
+        other = BCHGolayCoder(n=15, k=7, t=2, gf_context=self.ctx)
+        self.assertIs(other._encode, self.coder._encode)
+
     def test_syndrome_zero_codeword(self):
         # Syndrome of a valid codeword must be all zeros
         codeword = np.zeros(self.n, dtype=np.uint8)
@@ -87,6 +187,389 @@ class TestBCHKernels(unittest.TestCase):
         # S_i must be equal to alpha^(i * 0) = 1 for all i = 1 to 2t
         self.assertTrue(np.all(syndromes == 1))
 
+    def test_chase_pattern_metrics(self):
+        # metric[p] sums the reliabilities of the positions flipped by pattern p
+        rel_L = np.array([0.5, 0.25, 2.0])
+        metrics = _numba_chase_pattern_metrics(rel_L)
+        for p in range(8):
+            self.assertAlmostEqual(metrics[p], sum(rel_L[b] for b in range(3) if (p >> b) & 1))
+
+    def test_chase_decode_picks_lowest_metric(self):
+        # All-zero hard decision; positions 0 and 1 are the least reliable.
+        # Algebraic results (as positions differing from the hard decision) per
+        # test pattern; flipping both and having the decoder flip position 1 back
+        # gives the best candidate even though its pattern metric (1.1) exceeds
+        # the best metric found before it (0.6)
+        llrs = np.full(self.n, 5.0)
+        llrs[:2] = [0.5, 0.6]
+        results = {(): {1}, (0,): {0, 5}, (1,): {1, 6}, (0, 1): {0}}
+        def correct(test_codeword):
+            decoded = np.zeros(self.n, dtype=np.uint8)
+            decoded[list(results[tuple(np.nonzero(test_codeword)[0])])] = 1
+            return decoded, int(np.count_nonzero(decoded != test_codeword))
+        with mock.patch.object(self.coder, '_correct_algebraic', side_effect=correct):
+            decoded, _ = self.coder.decode(llrs, soft_decision=True, num_test_patterns=2)
+        expected = np.zeros(self.k, dtype=np.uint8)
+        expected[0] = 1
+        self.assertTrue(np.array_equal(decoded, expected))
+
+    def test_chase_decode_without_corrections(self):
+        # With no algebraic corrections the zero-flip pattern (metric 0) wins
+        data = np.random.randint(0, 2, self.k, dtype=np.uint8)
+        llrs = 4.0 * (1.0 - 2.0 * self.coder.encode(data))
+        llrs[3] *= -0.1
+        decoded, _ = self.coder.decode(llrs, soft_decision=True, num_test_patterns=3)
+        self.assertTrue(np.array_equal(decoded, llr_to_hard_bits(llrs)[:self.k]))
+
+    def test_pack_unpack_bits(self):
+        # Packing is LSB first within each uint64 word and round-trips exactly
+        bits = np.random.randint(0, 2, 100, dtype=np.uint8)
+        words = pack_bits(bits)
+        self.assertEqual(words.dtype, np.uint64)
+        self.assertEqual(len(words), 2)
+        self.assertEqual(int(words[0]) & 1, bits[0])
+        self.assertTrue(np.array_equal(unpack_bits(words, 100), bits))
+
+class TestLDPCDecoder(unittest.TestCase):
+    """Tests for the Min-Sum Belief Propagation decoder."""
+
+    def setUp(self):
+        # Hamming(7, 4) parity check matrix as a small LDPC-style code
+        H = np.array([[1, 1, 0, 1, 1, 0, 0],
+                      [1, 0, 1, 1, 0, 1, 0],
+                      [0, 1, 1, 1, 0, 0, 1]], dtype=np.uint8)
+        self.coder = LDPCoder(csr_matrix(H))
+
+    def test_decode_corrects_weak_error(self):
+        # All-zero codeword with one unreliable bit received in error
+        llrs = np.full(7, 4.0)
+        llrs[2] = -1.0
+        decoded = self.coder.decode(llrs)
+        self.assertTrue(np.all(decoded == 0))
+
+    def test_quantized_decode_corrects_weak_error(self):
+        # Same scenario with 6-bit int8 messages
+        coder = LDPCoder(self.coder.H, quantize_bits=6)
+        llrs = np.full(7, 4.0)
+        llrs[2] = -1.0
+        decoded = coder.decode(llrs)
+        self.assertTrue(np.all(decoded == 0))
+
+    def test_decode_degree_one_check(self):
+        # A single-entry row sends the min/second-min sentinel as its message
+        H = np.array([[1, 1, 0],
+                      [0, 1, 1],
+                      [0, 0, 1]], dtype=np.uint8)
+        decoded = LDPCoder(csr_matrix(H)).decode(np.array([2.0, -0.5, 3.0]))
+        self.assertTrue(np.all(decoded == 0))
+
+    def test_decode_rejects_bad_sizes(self):
+        # Wrong LLR count or output buffer is rejected before the kernel runs
+        with self.assertRaises(ValueError):
+            self.coder.decode(np.full(6, 4.0))
+        with self.assertRaises(ValueError):
+            self.coder.decode(np.full(7, 4.0), out=np.empty(6, dtype=np.uint8))
+        with self.assertRaises(ValueError):
+            self.coder.decode(np.full(7, 4.0), out=np.empty(7, dtype=np.int64))
+        out = np.empty(7, dtype=np.uint8)
+        self.assertIs(self.coder.decode(np.full(7, 4.0), out=out), out)
+
+class TestTurboDecoder(unittest.TestCase):
+    """Tests for the RSC encoder and the iterative Max-Log-MAP decoder."""
+
+    def setUp(self):
+        self.k = 64
+        self.encoder = TurboEncoder(k=self.k)
+        self.decoder = TurboDecoder(k=self.k)
+        self.rng = np.random.default_rng(1)
+
+    def test_rsc_parity(self):
+        # (7, 5) RSC: the impulse response of 1 + x^2 / (1 + x + x^2) is 1 1 1 0 1 1 0 1 1 ...
+        data = np.zeros(self.k, dtype=np.uint8)
+        data[0] = 1
+        parity1 = self.encoder.encode(data)[self.k:2 * self.k]
+        self.assertTrue(np.array_equal(parity1[:9], [1, 1, 1, 0, 1, 1, 0, 1, 1]))
+
+    def test_decode_noisy_frame(self):
+        data = self.rng.integers(0, 2, self.k).astype(np.uint8)
+        codeword = self.encoder.encode(data)
+        sigma = 0.7
+        rx = 1.0 - 2.0 * codeword + sigma * self.rng.standard_normal(3 * self.k)
+        decoded = self.decoder.decode(2.0 * rx / sigma ** 2)
+        self.assertTrue(np.array_equal(decoded, data))
+
+    def test_specialized_map_kernel_matches_generic(self):
+        # The per-trellis kernel agrees with the generic one and is shared per code
+        L_a, R_sys, R_par = self.rng.standard_normal((3, self.k)).astype(np.float32)
+        expected = np.empty(self.k, dtype=np.float32)
+        _numba_map_decoder_kernel(L_a, R_sys, R_par, self.decoder.next_state, *self.decoder._butterfly,
+                                  self.decoder._alpha, self.decoder._beta, expected)
+        out = np.empty(self.k, dtype=np.float32)
+        self.decoder._map_kernel(L_a, R_sys, R_par, self.decoder._alpha, self.decoder._beta, out)
+        self.assertTrue(np.allclose(out, expected, atol=1e-4))
+        self.assertIs(TurboDecoder(k=2 * self.k)._map_kernel, self.decoder._map_kernel)
+
+    def test_decode_batch_matches_decode(self):
+        data = self.rng.integers(0, 2, (4, self.k)).astype(np.uint8)
+        codewords = np.array([self.encoder.encode(row) for row in data])
+        llrs = 2.0 * (1.0 - 2.0 * codewords + self.rng.standard_normal(codewords.shape))
+        decoded = self.decoder.decode_batch(llrs)
+        self.assertEqual(decoded.shape, (4, self.k))
+        for row, frame_llrs in zip(decoded, llrs):
+            self.assertTrue(np.array_equal(row, self.decoder.decode(frame_llrs)))
+
+    def test_crc_early_termination(self):
+        # A check that passes immediately stops decoding after the first iteration
+        calls = []
+        def crc_check(hard_bits):
+            calls.append(hard_bits.copy())
+            return True
+        decoder = TurboDecoder(k=self.k, max_iterations=8, crc_check=crc_check)
+        data = self.rng.integers(0, 2, self.k).astype(np.uint8)
+        llrs = 4.0 * (1.0 - 2.0 * self.encoder.encode(data))
+        decoded = decoder.decode(llrs)
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(np.array_equal(decoded, data))
+        decoded_batch = decoder.decode_batch(np.stack([llrs, llrs]))
+        self.assertEqual(len(calls), 3)
+        self.assertTrue(np.array_equal(decoded_batch[1], data))
+
+    def test_decode_symbols_zero_noise_variance(self):
+        # The LLR scale floor keeps noiseless frames finite through the float32 decoder
+        data = self.rng.integers(0, 2, self.k).astype(np.uint8)
+        rx = 1.0 - 2.0 * self.encoder.encode(data)
+        matcher = RateMatcher(code_rate=1 / 3, original_N=3 * self.k, target_N=3 * self.k,
+                              puncturing_pattern=np.ones(1, dtype=np.uint8))
+        decoded = self.decoder.decode_symbols(rx, 0.0, matcher)
+        self.assertTrue(np.array_equal(decoded, data))
+
+class TestModem(unittest.TestCase):
+    """Tests for the BPSK/QPSK modulators."""
+
+    def setUp(self):
+        self.modem = BPSKUnguided()
+
+    def test_bpsk_modulate(self):
+        # Bit 0 -> +1, bit 1 -> -1, written into the caller's buffer when given
+        bits = np.array([0, 1, 1, 0, 1], dtype=np.uint8)
+        out = np.empty(5)
+        symbols = self.modem.modulate(bits, out=out)
+        self.assertIs(symbols, out)
+        self.assertTrue(np.array_equal(symbols, [1.0, -1.0, -1.0, 1.0, -1.0]))
+        with self.assertRaises(ValueError):
+            self.modem.modulate(bits, out=np.empty(4))
+        with self.assertRaises(ValueError):
+            self.modem.modulate(bits, out=np.empty(5, dtype=np.float32))
+
+    def test_bpsk_demodulate(self):
+        # LLR = 2y / sigma^2; zero noise variance gives a huge but finite scale
+        rx = np.array([0.5, -1.0, 2.0])
+        self.assertTrue(np.allclose(self.modem.demodulate(rx, 0.5), [2.0, -4.0, 8.0]))
+        llrs = self.modem.demodulate(rx, 0.0)
+        self.assertTrue(np.all(np.isfinite(llrs)) and np.all(np.sign(llrs) == np.sign(rx)))
+        # Each call returns a fresh array unless the caller passes out
+        self.assertIsNot(self.modem.demodulate(rx, 0.5), self.modem.demodulate(rx, 0.5))
+        out = np.empty(3)
+        self.assertIs(self.modem.demodulate(rx, 0.5, out=out), out)
+
+    def test_qpsk_roundtrip(self):
+        # Gray-coded unit-energy symbols; LLR signs recover the bits in order
+        qpsk = QPSKUnguided()
+        bits = np.array([0, 0, 0, 1, 1, 0, 1, 1], dtype=np.uint8)
+        symbols = qpsk.modulate(bits)
+        self.assertTrue(np.allclose(np.abs(symbols), 1.0))
+        self.assertAlmostEqual(symbols[1], (1 - 1j) / np.sqrt(2))
+        llrs = qpsk.demodulate(symbols, 0.5)
+        self.assertTrue(np.array_equal(llr_to_hard_bits(llrs), bits))
+        self.assertTrue(np.allclose(np.abs(llrs), 2.0))
+
+    def test_modulate_packed_matches_unpacked(self):
+        # 8 bits per byte (LSB first), including a partial trailing byte
+        bits = np.random.randint(0, 2, 21, dtype=np.uint8)
+        symbols = modulate_packed(np.packbits(bits, bitorder='little'), n=21)
+        self.assertEqual(symbols.dtype, np.int8)
+        self.assertTrue(np.array_equal(symbols, self.modem.modulate(bits)))
+        symbols = self.modem.modulate_packed(np.packbits(bits, bitorder='little'), n=21)
+        self.assertEqual(symbols.dtype, np.float64)
+        self.assertTrue(np.array_equal(symbols, self.modem.modulate(bits)))
+        # Same positional order (bits_packed, n, out) for the function and the method
+        packed = np.packbits(bits, bitorder='little')
+        self.assertTrue(np.array_equal(modulate_packed(packed, 21, np.empty(21, dtype=np.int8)), symbols))
+        out = np.empty(21)
+        self.assertIs(self.modem.modulate_packed(packed, 21, out), out)
+        with self.assertRaises(ValueError):
+            self.modem.modulate_packed(packed, out=np.empty(21, dtype=np.float32))
+        with self.assertRaises(ValueError):
+            self.modem.modulate_packed(packed, 21, np.empty(20))
+
+class TestRateMatcher(unittest.TestCase):
+    """Tests for puncturing and depuncturing."""
+
+    def setUp(self):
+        self.pattern = np.array([1, 1, 0, 1, 0, 1], dtype=np.uint8)
+        self.matcher = RateMatcher(code_rate=0.5, original_N=30, target_N=20, puncturing_pattern=self.pattern)
+
+    def test_puncture_depuncture_roundtrip(self):
+        # Kept positions survive the round trip, punctured ones come back as 0 LLRs
+        llrs = np.random.randn(30)
+        restored = self.matcher.depuncture(self.matcher.puncture(llrs))
+        keep = np.tile(self.pattern, 5) == 1
+        self.assertTrue(np.array_equal(restored[keep], llrs[keep]))
+        self.assertTrue(np.all(restored[~keep] == 0.0))
+
+    def test_packed_puncture_matches_unpacked(self):
+        bits = np.random.randint(0, 2, 30, dtype=np.uint8)
+        punctured = self.matcher.puncture_packed(pack_bits(bits))
+        self.assertTrue(np.array_equal(unpack_bits(punctured, 20), self.matcher.puncture(bits)))
+        restored = unpack_bits(self.matcher.depuncture_packed(punctured), 30)
+        self.assertTrue(np.array_equal(restored, self.matcher.depuncture(self.matcher.puncture(bits))))
+
+    def test_packed_length_checks(self):
+        # Short packed inputs would be read out of bounds by the kernels
+        matcher = RateMatcher(code_rate=0.5, original_N=300, target_N=200, puncturing_pattern=self.pattern)
+        with self.assertRaises(ValueError):
+            matcher.puncture_packed(np.zeros(1, dtype=np.uint64))
+        with self.assertRaises(ValueError):
+            matcher.depuncture_packed(np.zeros(3, dtype=np.uint64))
+        self.assertEqual(len(matcher.depuncture_packed(np.zeros(4, dtype=np.uint64))), 5)
+
+    def test_soft_pext_pdep(self):
+        # Portable fallbacks: gather/scatter the bits selected by the mask
+        self.assertEqual(_soft_pext(np.uint64(0b101101), np.uint64(0b111000)), 0b101)
+        self.assertEqual(_soft_pdep(np.uint64(0b101), np.uint64(0b111000)), 0b101000)
+
+    def test_fused_demodulate_depuncture(self):
+        rx = np.random.randn(20)
+        fused = self.matcher.demodulate_depuncture(rx, 4.0)
+        self.assertTrue(np.allclose(fused, self.matcher.depuncture(4.0 * rx)))
+
+class TestAOTKernels(unittest.TestCase):
+    """
+    Runs the public entry points through the ahead-of-time compiled kernels.
+    The pycc entry points do not type-check their arguments, so the Python
+    wrappers must convert or reject bad inputs before calling them.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        from pyhpfec import _aot_build
+        cls.build_dir = tempfile.mkdtemp()
+        output_dir = _aot_build.cc.output_dir
+        try:
+            _aot_build.cc.output_dir = cls.build_dir
+            _aot_build.cc.compile()
+        except Exception as exc:
+            shutil.rmtree(cls.build_dir)
+            raise unittest.SkipTest(f"AOT build unavailable: {exc}")
+        finally:
+            _aot_build.cc.output_dir = output_dir
+        path = glob.glob(f"{cls.build_dir}/pyhpfec_kernels*")[0]
+        spec = importlib.util.spec_from_file_location('pyhpfec_kernels', path)
+        cls.kernels = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.kernels)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.build_dir)
+
+    def setUp(self):
+        for module, name, kernel in ((modem, '_bpsk_modulate', self.kernels.bpsk_modulate),
+                                     (modem, '_bpsk_modulate_packed', self.kernels.bpsk_modulate_packed),
+                                     (rate_match, '_demod_depuncture', self.kernels.demod_depuncture)):
+            patcher = mock.patch.object(module, name, kernel)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_modulate_converts_bits(self):
+        # int64 bits are converted to uint8 instead of being reinterpreted
+        symbols = BPSKUnguided().modulate(np.array([0, 1, 1, 0]))
+        self.assertTrue(np.array_equal(symbols, [1.0, -1.0, -1.0, 1.0]))
+
+    def test_modulate_packed_checks_inputs(self):
+        packed = np.array([5, 7])
+        expected = 1 - 2 * np.unpackbits(packed.astype(np.uint8), bitorder='little').astype(np.int8)
+        self.assertTrue(np.array_equal(modulate_packed(packed, n=16), expected))
+        with self.assertRaises(ValueError):
+            modulate_packed(packed.astype(np.uint8), out=np.empty(16))
+        with self.assertRaises(ValueError):
+            modulate_packed(packed.astype(np.uint8), out=np.empty(32, dtype=np.int8)[::2])
+
+    def test_demodulate_depuncture_checks_out(self):
+        matcher = RateMatcher(code_rate=0.5, original_N=12, target_N=8, puncturing_pattern=np.array([1, 1, 0]))
+        rx = np.array([1, -1, 1, -1, 1, -1, 1, -1])
+        llrs = matcher.demodulate_depuncture(rx, 2.0)
+        self.assertTrue(np.array_equal(llrs, matcher.depuncture(2.0 * rx)))
+        with self.assertRaises(ValueError):
+            matcher.demodulate_depuncture(rx, 2.0, out=np.empty(12, dtype=np.float32))
+
+class TestAWGNChannel(unittest.TestCase):
+    """Tests for the AWGN channel model."""
+
+    def setUp(self):
+        self.tx = 1.0 - 2.0 * np.random.randint(0, 2, 16)
+
+    def test_same_seed_reproducible(self):
+        rx_a = AWGNChannel(EbNo_dB=3.0, seed=7).transmit(self.tx, k=8, n=16)
+        rx_b = AWGNChannel(EbNo_dB=3.0, seed=7).transmit(self.tx, k=8, n=16)
+        self.assertTrue(np.array_equal(rx_a.symbols, rx_b.symbols))
+        # sigma^2 = N0 / 2 with N0 = 1 / (R * Eb/N0)
+        self.assertAlmostEqual(rx_a.noise_variance, 1.0 / (2 * 0.5 * 10 ** 0.3))
+
+    def test_noise_buffer_reuse_and_out(self):
+        channel = AWGNChannel(EbNo_dB=3.0, seed=1)
+        channel.transmit(self.tx, k=8, n=16)
+        noise_buf = channel._noise_buf
+        out = np.empty(16)
+        rx = channel.transmit(self.tx, k=8, n=16, out=out)
+        self.assertIs(channel._noise_buf, noise_buf)
+        self.assertIs(rx.symbols, out)
+        self.assertFalse(np.array_equal(out, self.tx))
+
+    def test_transmit_batch(self):
+        channel = AWGNChannel(EbNo_dB=3.0, seed=1)
+        rx = channel.transmit_batch(np.tile(self.tx, (5, 1)), k=8, n=16)
+        self.assertEqual(rx.symbols.shape, (5, 16))
+        self.assertIsInstance(rx.noise_variance, float)
+        self.assertEqual(rx.noise_variance, channel.transmit(self.tx, k=8, n=16).noise_variance)
+        with self.assertRaises(ValueError):
+            channel.transmit_batch(self.tx, k=8, n=16)
+        with self.assertRaises(ValueError):
+            channel.transmit_batch(np.tile(self.tx, (5, 1)), k=8, n=15)
+
+    def test_rx_block_fields(self):
+        rx = AWGNChannel(EbNo_dB=3.0, seed=1).transmit(self.tx, k=8, n=16)
+        self.assertIsInstance(rx, RxBlock)
+        self.assertEqual(RxBlock._fields, ('symbols', 'noise_variance'))
+        symbols, noise_variance = rx
+        self.assertIs(symbols, rx.symbols)
+        self.assertEqual(noise_variance, rx.noise_variance)
+
+    def test_transmit_complex_symbols(self):
+        # Complex (e.g. QPSK) symbols get independent noise on both quadratures;
+        # each unit-energy symbol carries 2 coded bits, so sigma^2 = 1 / (4 * R * Eb/N0)
+        channel = AWGNChannel(EbNo_dB=0.0, seed=3)
+        tx = QPSKUnguided().modulate(np.zeros(20000, dtype=np.uint8))
+        rx = channel.transmit(tx, k=20000, n=20000)
+        self.assertEqual(rx.symbols.dtype, np.complex128)
+        self.assertAlmostEqual(rx.noise_variance, 0.25)
+        noise = rx.symbols - tx
+        self.assertAlmostEqual(noise.real.var(), rx.noise_variance, delta=0.02)
+        self.assertAlmostEqual(noise.imag.var(), rx.noise_variance, delta=0.02)
+        rx_batch = channel.transmit_batch(np.tile(tx, (2, 1)), k=20000, n=20000)
+        self.assertEqual(rx_batch.symbols.dtype, np.complex128)
+        self.assertEqual(rx_batch.noise_variance, rx.noise_variance)
+        self.assertEqual(channel.transmit(tx, k=1, n=1, bits_per_symbol=1).noise_variance, 0.5)
+
+    def test_uncoded_ber_matches_theory(self):
+        # Uncoded BPSK and Gray-coded QPSK both have BER = Q(sqrt(2 Eb/N0)) over AWGN
+        num_bits = 200000
+        bits = np.random.default_rng(5).integers(0, 2, num_bits, dtype=np.uint8)
+        theory = 0.5 * math.erfc(1.0) # Eb/N0 = 0 dB
+        for modem in (BPSKUnguided(), QPSKUnguided()):
+            rx = AWGNChannel(EbNo_dB=0.0, seed=11).transmit(modem.modulate(bits), k=num_bits, n=num_bits)
+            decided = llr_to_hard_bits(modem.demodulate(rx.symbols, rx.noise_variance))
+            self.assertAlmostEqual(np.mean(decided != bits), theory, delta=0.003)
+
 class TestLLRUtilities(unittest.TestCase):
     """Tests for LLR conversion and Log-MAP approximations."""
     
@@ -113,6 +596,18 @@ class TestLLRUtilities(unittest.TestCase):
         expected = 2.0 + np.log(2) # ~ 2.693
         self.assertAlmostEqual(result, expected, delta=0.001)
 
+    def test_log_map_approx_array(self):
+        # Output sign is the product of input signs, magnitude the smaller input magnitude
+        L_a = np.array([10.0, -3.0, 2.0, -0.5], dtype=np.float32)
+        L_b = np.array([1.0, 4.0, -2.5, -7.0], dtype=np.float32)
+        out = np.empty_like(L_a)
+        log_map_approx_array(L_a, L_b, out)
+        expected = np.array([1.0, -3.0, -2.0, 0.5], dtype=np.float32)
+        self.assertTrue(np.array_equal(out, expected))
+        # In place: out aliases an input
+        log_map_approx_array(L_a, L_b, L_a)
+        self.assertTrue(np.array_equal(L_a, expected))
+
 if __name__ == '__main__':
     unittest.main()
 